@@ -1,63 +1,36 @@
+import os
 import tkinter as tk
 from tkinter import ttk, messagebox
 
+from booking_core.catalog import destination_names
+from booking_core.launcher import journaled, run_app
+from booking_core.stacks import Stack
+from booking_core.table_sync import TreeviewSync
+from booking_core.trees import BalancedBinaryTree
+from booking_core.trie import Trie
+from booking_core.validation import PHONE_ERROR, is_valid_phone
 
-class Stack:
-    def __init__(self):
-        self.stack = []
-
-    def push(self, item):
-        self.stack.append(item)
-
-    def pop(self):
-        if not self.is_empty():
-            return self.stack.pop()
-        else:
-            return "Stack is empty"
-
-    def is_empty(self):
-        return len(self.stack) == 0
-
-
-class Node:
-    def __init__(self, key):
-        self.key = key
-        self.left = None
-        self.right = None
-
-
-class BinaryTree:
-    def __init__(self):
-        self.root = None
-
-    def insert(self, key):
-        if self.root is None:
-            self.root = Node(key)
-        else:
-            self._insert_recursive(self.root, key)
-
-    def _insert_recursive(self, current, key):
-        if key < current.key:
-            if current.left is None:
-                current.left = Node(key)
-            else:
-                self._insert_recursive(current.left, key)
-        else:
-            if current.right is None:
-                current.right = Node(key)
-            else:
-                self._insert_recursive(current.right, key)
+JOURNAL_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "journal", "2")
+STATS_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "stats", "2.json")
 
 
 class BookingApp:
-    def __init__(self, root):
+    def __init__(self, root, durable=False):
         self.root = root
         self.root.title("Tourism and Travel Booking System")
         self.root.state("zoomed")  # Maximized state
         self.root.configure(bg="#f8f9fa")
 
         self.history_stack = Stack()
-        self.booking_tree = BinaryTree()
+        self.booking_tree = BalancedBinaryTree()
+        self.store = None  # Kept on disk; run_app closes it
+        if durable:
+            self.booking_tree = self.store = journaled(self.booking_tree, JOURNAL_DIR)
+
+        # Destination names from the catalog, for as-you-type suggestions
+        self.destinations = Trie()
+        for name in destination_names():
+            self.destinations.add(name)
 
         # Styling
         self.style = ttk.Style()
@@ -69,6 +42,8 @@ class BookingApp:
 
         # Widgets
         self.create_widgets()
+        if self.store is not None:
+            self.show_all_bookings()
 
     def create_widgets(self):
         # Title
@@ -95,13 +70,19 @@ class BookingApp:
 
         self.search_entry = ttk.Entry(search_frame, width=30)
         self.search_entry.grid(row=0, column=0, padx=10, pady=5)
+        self.search_entry.bind("<KeyRelease>", self.update_suggestions)
         ttk.Button(search_frame, text="Search", command=self.add_to_history).grid(
             row=0, column=1, padx=10, pady=5
         )
 
+        # Suggestions list, refreshed on every keystroke
+        self.suggestion_list = tk.Listbox(search_frame, height=5, font=("Arial", 11))
+        self.suggestion_list.grid(row=1, column=0, padx=10, pady=5, sticky="ew")
+        self.suggestion_list.bind("<<ListboxSelect>>", self.choose_suggestion)
+
         ttk.Button(
             search_frame, text="View Last Search", command=self.view_last_search
-        ).grid(row=1, column=0, columnspan=2, pady=5)
+        ).grid(row=2, column=0, columnspan=2, pady=5)
 
         # Frame for Booking
         booking_frame = ttk.LabelFrame(left_frame, text="Add Booking", padding=20)
@@ -129,6 +110,20 @@ class BookingApp:
             row=3, column=0, columnspan=2, pady=10
         )
 
+        # Frame for Finding Bookings by customer name
+        find_frame = ttk.LabelFrame(left_frame, text="Find Booking", padding=20)
+        find_frame.pack(pady=10, fill="x")
+
+        self.find_entry = ttk.Entry(find_frame, width=30)
+        self.find_entry.grid(row=0, column=0, padx=10, pady=5)
+        ttk.Button(find_frame, text="Find", command=self.find_bookings).grid(
+            row=0, column=1, padx=10, pady=5
+        )
+
+        ttk.Button(
+            find_frame, text="Show All Bookings", command=self.show_all_bookings
+        ).grid(row=1, column=0, columnspan=2, pady=5)
+
         # Booking History Section
         right_frame = ttk.LabelFrame(main_frame, text="Booking History", padding=20)
         right_frame.pack(side="right", fill="both", expand=True, padx=10)
@@ -142,6 +137,7 @@ class BookingApp:
         self.tree.column("Name", anchor="center", width=200)
         self.tree.column("Phone", anchor="center", width=150)
         self.tree.column("Booking", anchor="center", width=300)
+        self.history_view = TreeviewSync(self.tree)
 
         scrollbar = ttk.Scrollbar(right_frame, orient="vertical", command=self.tree.yview)
         self.tree.configure(yscroll=scrollbar.set)
@@ -160,12 +156,35 @@ class BookingApp:
     def add_to_history(self):
         destination = self.search_entry.get()
         if destination:
-            self.history_stack.push(destination)
-            messagebox.showinfo("Success", f"Added '{destination}' to search history.")
+            known_destination = self.destinations.get(destination)
+            if known_destination is None:
+                suggestions = self.destinations.complete_fuzzy(destination, 3)
+                hint = f"\nDid you mean: {', '.join(suggestions)}?" if suggestions else ""
+                messagebox.showwarning("Warning", f"'{destination}' is not in the destination catalog.{hint}")
+                return
+
+            self.history_stack.push(known_destination)
+            self.destinations.bump(known_destination)  # Popular destinations rank first
+            messagebox.showinfo("Success", f"Added '{known_destination}' to search history.")
             self.search_entry.delete(0, tk.END)
+            self.suggestion_list.delete(0, tk.END)
         else:
             messagebox.showwarning("Warning", "Please enter a destination to search.")
 
+    def update_suggestions(self, event):
+        # Exact prefix matches first, then names one typo away
+        text = self.search_entry.get()
+        self.suggestion_list.delete(0, tk.END)
+        if text:
+            for name in self.destinations.complete_fuzzy(text, 5):
+                self.suggestion_list.insert(tk.END, name)
+
+    def choose_suggestion(self, event):
+        selection = self.suggestion_list.curselection()
+        if selection:
+            self.search_entry.delete(0, tk.END)
+            self.search_entry.insert(0, self.suggestion_list.get(selection[0]))
+
     def view_last_search(self):
         last_search = self.history_stack.pop()
         if last_search == "Stack is empty":
@@ -182,24 +201,39 @@ class BookingApp:
             messagebox.showwarning("Warning", "Please fill out all fields.")
             return
 
-        if not phone.isdigit() or len(phone) != 10 or not (
-            phone.startswith("078") or phone.startswith("079")
-        ):
-            messagebox.showwarning(
-                "Warning", "Phone number must start with '078' or '079' and contain 10 digits."
-            )
+        if not is_valid_phone(phone):
+            messagebox.showwarning("Warning", PHONE_ERROR)
             return
 
         self.booking_tree.insert((name, phone, booking))
-        self.tree.insert("", "end", values=(name, phone, booking))
+        self.history_view.append((name, phone, booking))
         messagebox.showinfo("Success", f"Booking for '{booking}' added successfully.")
 
         self.name_entry.delete(0, tk.END)
         self.phone_entry.delete(0, tk.END)
         self.booking_entry.delete(0, tk.END)
 
+    def find_bookings(self):
+        # Show only the bookings whose name starts with the typed text
+        text = self.find_entry.get()
+        if not text:
+            messagebox.showwarning("Warning", "Please enter a name to find.")
+            return
+
+        matches = list(self.booking_tree.prefix(text))
+        if not matches:
+            messagebox.showinfo("Info", f"No bookings found for '{text}'.")
+            return
+
+        self.fill_history_table(matches)
+
+    def show_all_bookings(self):
+        self.find_entry.delete(0, tk.END)
+        self.fill_history_table(self.booking_tree)
+
+    def fill_history_table(self, bookings):
+        self.history_view.sync(bookings)
+
 
 if __name__ == "__main__":
-    root = tk.Tk()
-    app = BookingApp(root)
-    root.mainloop()
+    run_app(BookingApp, STATS_PATH, durable="--durable")
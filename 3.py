@@ -1,70 +1,36 @@
+import os
 import tkinter as tk
 from tkinter import ttk, messagebox
 
+from booking_core.launcher import journaled, run_app
+from booking_core.queues import CircularQueue
+from booking_core.table_sync import TreeviewSync, VirtualTable
+from booking_core.validation import PHONE_ERROR, is_valid_phone
 
-# Circular Queue Class
-class CircularQueue:
-    def __init__(self, size):
-        self.size = size
-        self.queue = [None] * size
-        self.front = -1
-        self.rear = -1
-
-    def is_full(self):
-        return (self.rear + 1) % self.size == self.front
-
-    def is_empty(self):
-        return self.front == -1
-
-    def enqueue(self, item):
-        if self.is_full():
-            return "Queue is full"
-        elif self.is_empty():
-            self.front = self.rear = 0
-        else:
-            self.rear = (self.rear + 1) % self.size
-        self.queue[self.rear] = item
-
-    def dequeue(self):
-        if self.is_empty():
-            return "Queue is empty"
-        elif self.front == self.rear:
-            item = self.queue[self.front]
-            self.front = self.rear = -1
-            return item
-        else:
-            item = self.queue[self.front]
-            self.front = (self.front + 1) % self.size
-            return item
-
-    def peek(self):
-        if self.is_empty():
-            return None
-        return self.queue[self.front]
-
-    def display(self):
-        if self.is_empty():
-            return []
-        elif self.rear >= self.front:
-            return self.queue[self.front : self.rear + 1]
-        else:
-            return self.queue[self.front :] + self.queue[: self.rear + 1]
-
-    def replace(self, index, new_item):
-        # Replace an item at a specific index
-        actual_index = (self.front + index) % self.size
-        self.queue[actual_index] = new_item
+JOURNAL_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "journal", "3")
+RING_PATH = os.path.join(JOURNAL_DIR, "bookings.ring")
+STATS_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "stats", "3.json")
 
 
 # GUI Application
 class BookingApp:
-    def __init__(self, root):
+    def __init__(self, root, virtual=False, durable=False, mapped=False):
         self.root = root
+        self.virtual = virtual  # Only keep the visible page of rows in the table
         self.root.title("Tourism and Travel Booking System")
         self.root.geometry("700x700")
         self.root.configure(bg="#f8f9fa")
 
-        self.booking_queue = CircularQueue(5)  # Circular Queue with a size of 5
+        self.booking_queue = CircularQueue(5, growable=True)  # Starts at 5, doubles when full
+        self.store = None  # Kept on disk; run_app closes it
+        if mapped:
+            # Keep the ring itself in a file that survives restarts and other processes can read
+            from booking_core.mapped_queue import MappedCircularQueue
+
+            os.makedirs(JOURNAL_DIR, exist_ok=True)
+            self.booking_queue = self.store = MappedCircularQueue(RING_PATH, 5, growable=True)
+        elif durable:
+            self.booking_queue = self.store = journaled(self.booking_queue, JOURNAL_DIR)
 
         # Styling
         self.style = ttk.Style()
@@ -79,6 +45,8 @@ class BookingApp:
 
         # Widgets
         self.create_widgets()
+        if self.store is not None:
+            self.update_queue_table()
 
     def create_widgets(self):
         # Title
@@ -133,6 +101,16 @@ class BookingApp:
         queue_scrollbar.pack(side="right", fill="y")
         self.queue_tree.pack(fill="both", expand=True)
 
+        if self.virtual:
+            self.queue_view = VirtualTable(
+                self.queue_tree,
+                queue_scrollbar,
+                count=lambda: len(self.booking_queue),
+                fetch=self.booking_queue.get_range,
+            )
+        else:
+            self.queue_view = TreeviewSync(self.queue_tree)
+
         self.queue_tree.bind("<<TreeviewSelect>>", self.on_item_select)
 
         # Footer
@@ -153,10 +131,8 @@ class BookingApp:
             messagebox.showwarning("Warning", "Please fill out all fields.")
             return
 
-        if not phone.isdigit() or len(phone) != 10 or not (phone.startswith("078") or phone.startswith("079")):
-            messagebox.showwarning(
-                "Warning", "Phone number must start with '078' or '079' and contain 10 digits."
-            )
+        if not is_valid_phone(phone):
+            messagebox.showwarning("Warning", PHONE_ERROR)
             return
 
         if self.selected_index is not None:
@@ -166,13 +142,20 @@ class BookingApp:
                 f"Do you want to replace the selected booking with:\n\nName: {name}\nPhone: {phone}\nBooking: {booking}?",
             )
             if replace_confirmation:
-                self.booking_queue.replace(self.selected_index, (name, phone, booking))
+                result = self.booking_queue.replace(self.selected_index, (name, phone, booking))
+                if result is not None:
+                    # The mapped ring's fixed-width fields refuse long names and destinations
+                    messagebox.showwarning("Warning", result)
+                    return
                 self.selected_index = None
         else:
             # Add booking
             result = self.booking_queue.enqueue((name, phone, booking))
             if result == "Queue is full":
                 messagebox.showwarning("Queue Full", "The booking queue is full. Please process some bookings.")
+            elif result is not None:
+                messagebox.showwarning("Warning", result)
+                return
 
         self.update_queue_table()
 
@@ -183,19 +166,16 @@ class BookingApp:
     def on_item_select(self, event):
         selected_item = self.queue_tree.selection()
         if selected_item:
-            self.selected_index = self.queue_tree.index(selected_item[0])
+            self.selected_index = self.queue_view.index(selected_item[0])
 
     def update_queue_table(self):
-        for item in self.queue_tree.get_children():
-            self.queue_tree.delete(item)
-
-        for booking in self.booking_queue.display():
-            self.queue_tree.insert("", "end", values=booking)
+        if self.virtual:
+            self.queue_view.refresh()
+        else:
+            # Only rows that changed since the last refresh touch the widget
+            self.queue_view.sync(self.booking_queue.display())
 
 
 # Main Application
 if __name__ == "__main__":
-    root = tk.Tk()
-    app = BookingApp(root)
-    
-    root.mainloop()
+    run_app(BookingApp, STATS_PATH, virtual="--virtual", durable="--durable", mapped="--mapped")
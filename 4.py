@@ -1,72 +1,36 @@
+import os
 import tkinter as tk
 from tkinter import ttk, messagebox
 
-# Linked List Node
-class Node:
-    def __init__(self, name, phone, booking):
-        self.name = name
-        self.phone = phone
-        self.booking = booking
-        self.next = None
-
-# Linked List Class
-class LinkedList:
-    def __init__(self, max_size=3):
-        self.head = None
-        self.tail = None
-        self.size = 0
-        self.max_size = max_size
-
-    def is_full(self):
-        return self.size == self.max_size
-
-    def add_booking(self, name, phone, booking):
-        if self.is_full():
-            return "List is full. Cannot add more bookings."
-        
-        new_node = Node(name, phone, booking)
-        
-        if self.head is None:
-            self.head = self.tail = new_node
-        else:
-            self.tail.next = new_node
-            self.tail = new_node
-
-        self.size += 1
-        return "Booking added successfully"
+from booking_core.launcher import journaled, run_app
+from booking_core.linked_list import IndexedLinkedList
+from booking_core.table_sync import TreeviewSync, VirtualTable
+from booking_core.validation import PHONE_ERROR, is_valid_phone
 
-    def remove_booking(self):
-        if self.head is None:
-            return "No bookings to remove"
-        
-        # Remove the first booking (head of the list)
-        removed_booking = self.head
-        self.head = self.head.next
-        self.size -= 1
-        
-        if self.head is None:  # List is now empty
-            self.tail = None
-
-        return removed_booking
-
-    def display(self):
-        bookings = []
-        current = self.head
-        while current:
-            bookings.append((current.name, current.phone, current.booking))
-            current = current.next
-        return bookings
+JOURNAL_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "journal", "4")
+DATABASE_PATH = os.path.join(JOURNAL_DIR, "bookings.db")
+STATS_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "stats", "4.json")
 
 
 # GUI Application
 class BookingApp:
-    def __init__(self, root):
+    def __init__(self, root, virtual=False, durable=False, database=False):
         self.root = root
+        self.virtual = virtual  # Only keep the visible page of rows in the table
         self.root.title("Tourism and Travel Booking System")
         self.root.geometry("700x700")
         self.root.configure(bg="#f8f9fa")
 
-        self.booking_list = LinkedList(max_size=3)
+        self.booking_list = IndexedLinkedList(max_size=3)
+        self.store = None  # Kept on disk; run_app closes it
+        if database:
+            # Same list interface, kept in SQLite with name, phone and destination indexed
+            from booking_core.sqlite_store import SQLiteBookingStore
+
+            os.makedirs(JOURNAL_DIR, exist_ok=True)
+            self.booking_list = self.store = SQLiteBookingStore(DATABASE_PATH, max_size=3, unique_phones=True)
+        elif durable:
+            self.booking_list = self.store = journaled(self.booking_list, JOURNAL_DIR)
 
         # Styling
         self.style = ttk.Style()
@@ -78,6 +42,8 @@ class BookingApp:
 
         # Widgets
         self.create_widgets()
+        if self.store is not None:
+            self.update_queue_table()
 
     def create_widgets(self):
         # Title
@@ -109,6 +75,9 @@ class BookingApp:
         ttk.Button(booking_frame, text="Add Booking", command=self.add_booking).grid(
             row=3, column=0, columnspan=2, pady=10
         )
+        ttk.Button(booking_frame, text="Cancel Booking by Phone", command=self.cancel_booking).grid(
+            row=4, column=0, columnspan=2, pady=5
+        )
 
         # Table Frame for Queue Processing
         queue_frame = ttk.LabelFrame(self.root, text="Booking List", padding=20)
@@ -132,6 +101,16 @@ class BookingApp:
         queue_scrollbar.pack(side="right", fill="y")
         self.queue_tree.pack(fill="both", expand=True)
 
+        if self.virtual:
+            self.queue_view = VirtualTable(
+                self.queue_tree,
+                queue_scrollbar,
+                count=lambda: len(self.booking_list),
+                fetch=self.booking_list.get_range,
+            )
+        else:
+            self.queue_view = TreeviewSync(self.queue_tree)
+
         # Footer
         footer_label = ttk.Label(
             self.root,
@@ -150,15 +129,15 @@ class BookingApp:
             messagebox.showwarning("Warning", "Please fill out all fields.")
             return
 
-        if not phone.isdigit() or len(phone) != 10 or not (phone.startswith("078") or phone.startswith("079")):
-            messagebox.showwarning(
-                "Warning", "Phone number must start with '078' or '079' and contain 10 digits."
-            )
+        if not is_valid_phone(phone):
+            messagebox.showwarning("Warning", PHONE_ERROR)
             return
 
         result = self.booking_list.add_booking(name, phone, booking)
         if result == "List is full. Cannot add more bookings.":
             messagebox.showwarning("List Full", "You cannot add more bookings. The list is full.")
+        elif result == "A booking with this phone number already exists.":
+            messagebox.showwarning("Duplicate Phone", result)
 
         self.update_queue_table()
 
@@ -168,14 +147,13 @@ class BookingApp:
         self.booking_entry.delete(0, tk.END)
 
     def update_queue_table(self):
-        # Clear all existing entries in the table
-        for item in self.queue_tree.get_children():
-            self.queue_tree.delete(item)
+        if self.virtual:
+            self.queue_view.refresh()
+            return
 
-        # Populate the table with the current list of bookings
+        # Apply only the rows that changed since the last refresh
         bookings = self.booking_list.display()
-        for booking in bookings:
-            self.queue_tree.insert("", "end", values=booking)
+        self.queue_view.sync(bookings)
 
     def remove_booking(self):
         removed_booking = self.booking_list.remove_booking()
@@ -188,9 +166,24 @@ class BookingApp:
         
         self.update_queue_table()
 
+    def cancel_booking(self):
+        phone = self.phone_entry.get()
+        if not phone:
+            messagebox.showwarning("Warning", "Please enter the phone number of the booking to cancel.")
+            return
+
+        removed_booking = self.booking_list.remove_by_phone(phone)
+        if removed_booking == "No booking found for this phone number":
+            messagebox.showinfo("Not Found", "No booking found for this phone number.")
+        else:
+            messagebox.showinfo(
+                "Booking Cancelled", f"Booking for {removed_booking.name} has been cancelled."
+            )
+            self.phone_entry.delete(0, tk.END)
+
+        self.update_queue_table()
+
 
 # Main Application
 if __name__ == "__main__":
-    root = tk.Tk()
-    app = BookingApp(root)
-    root.mainloop()
+    run_app(BookingApp, STATS_PATH, virtual="--virtual", durable="--durable", database="--sqlite")
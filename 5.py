@@ -1,46 +1,31 @@
+import os
 import tkinter as tk
 from tkinter import ttk, messagebox
 
-# Stack Class for managing bookings
-class BookingStack:
-    def __init__(self, max_size=3):
-        self.stack = []
-        self.max_size = max_size
+from booking_core.launcher import journaled, run_app
+from booking_core.persistent_stack import PersistentBookingStack
+from booking_core.table_sync import TreeviewSync, VirtualTable
+from booking_core.validation import PHONE_ERROR, is_valid_phone
 
-    def is_full(self):
-        return len(self.stack) == self.max_size
-
-    def push(self, name, phone, booking):
-        if self.is_full():
-            return "Stack is full. Cannot add more bookings."
-        self.stack.append((name, phone, booking))
-        return "Booking added successfully"
-
-    def pop(self):
-        if not self.stack:
-            return "No bookings to remove"
-        return self.stack.pop()
-
-    def peek(self):
-        if not self.stack:
-            return "No bookings to show"
-        return self.stack[-1]
-
-    def display(self):
-        return self.stack
+JOURNAL_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "journal", "5")
+STATS_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "stats", "5.json")
 
 
 # GUI Application
 class BookingApp:
-    def __init__(self, root):
+    def __init__(self, root, virtual=False, durable=False):
         self.root = root
+        self.virtual = virtual  # Only keep the visible page of rows in the table
         self.root.title("Tourism and Travel Booking System")
         
         # Set window to maximized
         self.root.state('zoomed')  # Maximizes the window without full screen
         self.root.configure(bg="#f8f9fa")
         
-        self.booking_stack = BookingStack(max_size=3)
+        self.booking_stack = PersistentBookingStack(max_size=3)  # Keeps every version for undo/redo
+        self.store = None  # Kept on disk; run_app closes it
+        if durable:
+            self.booking_stack = self.store = journaled(self.booking_stack, JOURNAL_DIR)
 
         # Styling
         self.style = ttk.Style()
@@ -52,6 +37,8 @@ class BookingApp:
 
         # Widgets
         self.create_widgets()
+        if self.store is not None:
+            self.update_stack_table()
 
     def create_widgets(self):
         # Title
@@ -106,8 +93,20 @@ class BookingApp:
         stack_scrollbar.pack(side="right", fill="y")
         self.stack_tree.pack(fill="both", expand=True)
 
+        if self.virtual:
+            self.stack_view = VirtualTable(
+                self.stack_tree,
+                stack_scrollbar,
+                count=lambda: len(self.booking_stack),
+                fetch=self.booking_stack.get_range,
+            )
+        else:
+            self.stack_view = TreeviewSync(self.stack_tree)
+
         ttk.Button(stack_frame, text="Remove Last Booking", command=self.remove_booking).pack(pady=5)
         ttk.Button(stack_frame, text="View Last Booking", command=self.view_last_booking).pack(pady=5)
+        ttk.Button(stack_frame, text="Undo", command=self.undo_action).pack(pady=5)
+        ttk.Button(stack_frame, text="Redo", command=self.redo_action).pack(pady=5)
 
         # Footer
         footer_label = ttk.Label(
@@ -127,10 +126,8 @@ class BookingApp:
             messagebox.showwarning("Warning", "Please fill out all fields.")
             return
 
-        if not phone.isdigit() or len(phone) != 10 or not (phone.startswith("078") or phone.startswith("079")):
-            messagebox.showwarning(
-                "Warning", "Phone number must start with '078' or '079' and contain 10 digits."
-            )
+        if not is_valid_phone(phone):
+            messagebox.showwarning("Warning", PHONE_ERROR)
             return
 
         result = self.booking_stack.push(name, phone, booking)
@@ -145,14 +142,13 @@ class BookingApp:
         self.booking_entry.delete(0, tk.END)
 
     def update_stack_table(self):
-        # Clear all existing entries in the table
-        for item in self.stack_tree.get_children():
-            self.stack_tree.delete(item)
+        if self.virtual:
+            self.stack_view.refresh()
+            return
 
-        # Populate the table with the current stack of bookings
+        # Apply only the rows that changed since the last refresh
         bookings = self.booking_stack.display()
-        for booking in bookings:
-            self.stack_tree.insert("", "end", values=booking)
+        self.stack_view.sync(bookings)
 
     def remove_booking(self):
         removed_booking = self.booking_stack.pop()
@@ -175,9 +171,17 @@ class BookingApp:
                 f"Name: {last_booking[0]}\nPhone: {last_booking[1]}\nBooking: {last_booking[2]}",
             )
 
+    def undo_action(self):
+        if self.booking_stack.undo() == "Nothing to undo":
+            messagebox.showinfo("Undo", "Nothing to undo.")
+        self.update_stack_table()
+
+    def redo_action(self):
+        if self.booking_stack.redo() == "Nothing to redo":
+            messagebox.showinfo("Redo", "Nothing to redo.")
+        self.update_stack_table()
+
 
 # Main Application
 if __name__ == "__main__":
-    root = tk.Tk()
-    app = BookingApp(root)
-    root.mainloop()
+    run_app(BookingApp, STATS_PATH, virtual="--virtual", durable="--durable")
@@ -0,0 +1,2 @@
+# Benchmarks for the booking data structures; run them from the repository
+# root, e.g. "python -m benchmarks.memory"
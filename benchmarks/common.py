@@ -0,0 +1,16 @@
+import os
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+DESTINATIONS = ["Kivu Beach Rubavu", "Kivu Beach Rusizi", "Mount Muhabura", "Mount Karisimbi", "Mount Bisoke"]
+
+
+def make_bookings(count, priorities=False):
+    # Fresh string objects per booking, the way parsed input would arrive
+    for i in range(count):
+        name = f"Customer {i:07d}"
+        phone = f"078{i:07d}"
+        booking = DESTINATIONS[i % len(DESTINATIONS)].encode().decode()
+        if priorities:
+            yield (name, phone, booking, i % 5 + 1)
+        else:
+            yield (name, phone, booking)
@@ -0,0 +1,69 @@
+import argparse
+import time
+
+from benchmarks.common import make_bookings
+from booking_core.dispatcher import PriorityDispatcher
+from booking_core.stacks import PriorityBookingStack
+
+ARRIVALS_PER_ROUND = 10
+DISPATCHES_PER_ROUND = 5
+
+
+def run_workload(count, add, dispatch):
+    """Bookings arrive in rounds, half as many get dispatched each round, then drain."""
+    bookings = list(make_bookings(count, priorities=True))
+    start = time.perf_counter()
+    operations = 0
+    for first in range(0, count, ARRIVALS_PER_ROUND):
+        for booking in bookings[first : first + ARRIVALS_PER_ROUND]:
+            add(booking)
+            operations += 1
+        for _ in range(DISPATCHES_PER_ROUND):
+            dispatch()
+            operations += 1
+    while dispatch() is not None:
+        operations += 1
+    return operations / (time.perf_counter() - start)
+
+
+def sort_then_pop(count):
+    # The current approach: bucket_sort before every dispatch, then take the front
+    stack = PriorityBookingStack(max_size=count)
+
+    def dispatch():
+        if not stack.stack:
+            return None
+        stack.bucket_sort()
+        return stack.stack.pop(0)
+
+    return run_workload(count, lambda booking: stack.push(*booking), dispatch)
+
+
+def heap_dispatcher(count, aging_rate=0.0):
+    dispatcher = PriorityDispatcher(aging_rate)
+
+    def dispatch():
+        if not len(dispatcher):
+            return None
+        return dispatcher.pop()
+
+    return run_workload(count, dispatcher.push, dispatch)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Dispatch throughput: heap vs sort-then-pop.")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1_000, 10_000])
+    args = parser.parse_args()
+
+    print(f"{'Bookings':>10}{'sort-then-pop ops/s':>22}{'heap ops/s':>14}{'heap+aging ops/s':>20}")
+    for count in args.sizes:
+        print(
+            f"{count:>10}"
+            f"{sort_then_pop(count):>22,.0f}"
+            f"{heap_dispatcher(count):>14,.0f}"
+            f"{heap_dispatcher(count, aging_rate=0.01):>20,.0f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
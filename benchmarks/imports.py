@@ -0,0 +1,111 @@
+import argparse
+import compileall
+import json
+import os
+import subprocess
+import sys
+
+from benchmarks.common import ROOT
+
+LIMIT_MS = 20  # Budget for a cold import of every core structure at once
+
+# The structures and helpers batch jobs use; none of them may pull in tkinter
+CORE = [
+    "booking_core.stacks",
+    "booking_core.trees",
+    "booking_core.queues",
+    "booking_core.linked_list",
+    "booking_core.catalog",
+    "booking_core.persistent_stack",
+    "booking_core.dispatcher",
+    "booking_core.trie",
+    "booking_core.records",
+    "booking_core.sorting",
+    "booking_core.overflow",
+    "booking_core.table_sync",
+    "booking_core.validation",
+    "booking_core.launcher",
+]
+
+# Backends the apps only load behind a flag; reported, not held to the budget
+OPTIONAL = [
+    "booking_core.journal",
+    "booking_core.mapped_queue",
+    "booking_core.sqlite_store",
+    "booking_core.importer",
+    "booking_core.instrumentation",
+]
+
+
+def import_time(modules):
+    """Microseconds to import modules in a fresh interpreter, and whether tkinter came along.
+
+    Read from -X importtime, so interpreter startup is left out.
+    """
+    code = f"import sys, {', '.join(modules)}; sys.exit(3 if 'tkinter' in sys.modules else 0)"
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code],
+        cwd=ROOT,
+        capture_output=True,
+        text=True,
+    )
+    if result.returncode not in (0, 3):
+        raise RuntimeError(result.stderr.strip().splitlines()[-1])
+
+    total = 0
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:"):
+            continue
+        _, cumulative, name = line.split("|")
+        # Only the top-level entries: nested ones are already in their parent's total
+        if not name.startswith("  ") and name.strip() in modules:
+            total += int(cumulative)
+    return total, result.returncode == 3
+
+
+def measure(modules, repeat):
+    best = None
+    pulls_tkinter = False
+    for _ in range(repeat):
+        elapsed, tkinter_loaded = import_time(modules)
+        best = elapsed if best is None else min(best, elapsed)
+        pulls_tkinter = pulls_tkinter or tkinter_loaded
+    return best / 1000, pulls_tkinter
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Time cold imports of the booking_core modules.")
+    parser.add_argument("--repeat", type=int, default=5, help="best of this many fresh interpreters")
+    parser.add_argument("--limit", type=float, default=LIMIT_MS, help="milliseconds allowed for the whole core")
+    parser.add_argument("--output", help="also write the timings here as JSON")
+    args = parser.parse_args()
+
+    # Bytecode up to date first, so the timings are imports and not compiles
+    compileall.compile_dir(os.path.join(ROOT, "booking_core"), quiet=1)
+
+    timings = {}
+    failed = False
+    print(f"{'Module':<34}{'ms':>8}  notes")
+    for label, modules in (
+        [(module, [module]) for module in CORE + OPTIONAL]
+        + [("all core modules", CORE), ("tkinter (for comparison)", ["tkinter"])]
+    ):
+        ms, pulls_tkinter = measure(modules, args.repeat)
+        timings[label] = round(ms, 2)
+        notes = []
+        if pulls_tkinter and modules != ["tkinter"]:
+            notes.append("IMPORTS TKINTER")
+            failed = True
+        if label == "all core modules" and ms > args.limit:
+            notes.append(f"OVER THE {args.limit:g} ms BUDGET")
+            failed = True
+        print(f"{label:<34}{ms:>8.2f}  {', '.join(notes)}")
+
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as output:
+            json.dump({"python": sys.version.split()[0], "limit_ms": args.limit, "timings": timings}, output, indent=2)
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
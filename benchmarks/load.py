@@ -0,0 +1,129 @@
+import argparse
+import asyncio
+import json
+import subprocess
+import sys
+import time
+
+from benchmarks.common import ROOT, make_bookings
+from booking_core.instrumentation import LatencyHistogram
+from booking_core.service import raise_open_file_limit
+
+CONNECT_AT_ONCE = 200  # Connects in flight together, so the listen backlog never overflows
+MIX = ["enqueue", "push", "peek", "dequeue", "pop"]  # Adds and removes balance, so sizes stay steady
+
+
+def request_lines(connection, count, sort_every):
+    """The encoded requests one client sends, cycling through MIX."""
+    lines = []
+    bookings = make_bookings(count, priorities=True)
+    for index in range(count):
+        op = "sort" if sort_every and index % sort_every == sort_every - 1 else MIX[index % len(MIX)]
+        request = {"id": index, "op": op}
+        name, phone, booking, priority = next(bookings)
+        if op == "enqueue":
+            request["booking"] = [f"{name} #{connection}", phone, booking]
+        elif op == "push":
+            request["booking"] = [f"{name} #{connection}", phone, booking, priority]
+        elif op == "peek":
+            request["target"] = "queue" if index % 2 else "stack"
+        lines.append(json.dumps(request, separators=(",", ":")).encode() + b"\n")
+    return lines
+
+
+async def connect(host, port, gate):
+    async with gate:
+        return await asyncio.open_connection(host, port)
+
+
+async def run_client(reader, writer, lines, pipeline, latencies):
+    # Send pipeline requests in one write, then read their answers; each
+    # request's latency runs from that write to its own answer
+    errors = 0
+    for first in range(0, len(lines), pipeline):
+        burst = lines[first : first + pipeline]
+        sent = time.perf_counter_ns()
+        writer.write(b"".join(burst))
+        await writer.drain()
+        for _ in burst:
+            line = await reader.readline()
+            if not line:
+                raise ConnectionError("Server closed the connection")
+            latencies.record(time.perf_counter_ns() - sent)
+            if b'"error"' in line:
+                errors += 1
+    writer.close()
+    return errors
+
+
+async def run_load(host, port, connections, requests, pipeline, sort_every):
+    gate = asyncio.Semaphore(CONNECT_AT_ONCE)
+    streams = await asyncio.gather(*(connect(host, port, gate) for _ in range(connections)))
+    work = [request_lines(connection, requests, sort_every) for connection in range(connections)]
+
+    latencies = LatencyHistogram()
+    start = time.perf_counter()
+    errors = await asyncio.gather(
+        *(run_client(reader, writer, lines, pipeline, latencies) for (reader, writer), lines in zip(streams, work))
+    )
+    elapsed = time.perf_counter() - start
+    return latencies, elapsed, sum(errors)
+
+
+def start_server():
+    # A separate process, so the server does not share an event loop (or a core) with the clients
+    server = subprocess.Popen(
+        [sys.executable, "-m", "booking_core.service", "--port", "0"],
+        cwd=ROOT,
+        stdout=subprocess.PIPE,
+        text=True,
+    )
+    line = server.stdout.readline()
+    if not line:
+        raise RuntimeError("Booking service did not start")
+    host, port = line.split()[-1].rsplit(":", 1)
+    return server, host, int(port)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Drive the booking service with many concurrent clients.")
+    parser.add_argument("--connect", help="HOST:PORT of a running service; default: start one")
+    parser.add_argument("--connections", type=int, default=1000)
+    parser.add_argument("--requests", type=int, default=100, help="requests per connection")
+    parser.add_argument("--pipeline", type=int, default=10, help="requests sent before waiting for answers")
+    parser.add_argument("--sort-every", type=int, default=1000, help="make every Nth request a sort (0: never)")
+    args = parser.parse_args()
+
+    limit = raise_open_file_limit()
+    if limit is not None and limit < args.connections + 100:
+        print(f"Open file limit is {limit}; expect connection errors above that many clients", file=sys.stderr)
+
+    server = None
+    if args.connect:
+        host, port = args.connect.rsplit(":", 1)
+        port = int(port)
+    else:
+        server, host, port = start_server()
+
+    try:
+        latencies, elapsed, errors = asyncio.run(
+            run_load(host, port, args.connections, args.requests, args.pipeline, args.sort_every)
+        )
+    finally:
+        if server is not None:
+            server.terminate()
+            server.wait()
+
+    total = latencies.count
+    print(f"{args.connections:,} connections x {args.requests:,} requests, pipeline {args.pipeline}")
+    print(f"{total:,} requests in {elapsed:.2f} s: {total / elapsed:,.0f} requests/s ({errors:,} errors)")
+    print(
+        f"latency p50 {latencies.percentile(50) / 1e6:.2f} ms, "
+        f"p99 {latencies.percentile(99) / 1e6:.2f} ms, "
+        f"max {latencies.max / 1e6:.2f} ms"
+    )
+    return 1 if errors else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
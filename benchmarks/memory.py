@@ -0,0 +1,159 @@
+import argparse
+import tracemalloc
+
+from benchmarks.common import make_bookings
+from booking_core import catalog as catalog_module, linked_list as linked_list_module, trees
+from booking_core.catalog import Tree
+from booking_core.linked_list import LinkedList
+from booking_core.queues import CircularQueue
+from booking_core.records import BookingColumns, BookingRecord
+from booking_core.stacks import BookingStack, PriorityBookingStack, Stack
+
+
+# The node classes as they were before __slots__, kept here as the baseline
+class DictTreeNode:
+    def __init__(self, key):
+        self.key = key
+        self.left = None
+        self.right = None
+
+
+class DictAVLNode(DictTreeNode):
+    def __init__(self, key):
+        super().__init__(key)
+        self.height = 1
+
+
+class DictListNode:
+    def __init__(self, name, phone, booking):
+        self.name = name
+        self.phone = phone
+        self.booking = booking
+        self.next = None
+
+
+class DictCatalogNode:
+    def __init__(self, data, node_id=0, parent=None):
+        self.data = data
+        self.children = []
+        self.node_id = node_id
+        self.parent = parent
+
+    def add_child(self, child_node):
+        child_node.parent = self
+        self.children.append(child_node)
+
+
+def measure(build, count):
+    """Bytes allocated per booking while building (and holding) a structure."""
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    structure = build(count)
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del structure
+    return (after - before) / count
+
+
+def with_class(module, name, replacement, build):
+    # Build with one of the module's node classes swapped for the baseline
+    def patched(count):
+        original = getattr(module, name)
+        setattr(module, name, replacement)
+        try:
+            return build(count)
+        finally:
+            setattr(module, name, original)
+
+    return patched
+
+
+def cases():
+    def stack(record):
+        def build(count):
+            stack = Stack()
+            for booking in make_bookings(count):
+                stack.push(BookingRecord(*booking) if record else booking)
+            return stack
+        return build
+
+    def tree(record):
+        def build(count):
+            tree = trees.BalancedBinaryTree()
+            for booking in make_bookings(count):
+                tree.insert(BookingRecord(*booking) if record else booking)
+            return tree
+        return build
+
+    def queue(record):
+        def build(count):
+            queue = CircularQueue(count)
+            for booking in make_bookings(count):
+                queue.enqueue(BookingRecord(*booking) if record else booking)
+            return queue
+        return build
+
+    def linked_list(count):
+        bookings = LinkedList(max_size=count)
+        for booking in make_bookings(count):
+            bookings.add_booking(*booking)
+        return bookings
+
+    def booking_stack(stack_class, priorities, record):
+        def build(count):
+            stack = stack_class(max_size=count)
+            for booking in make_bookings(count, priorities):
+                if record:
+                    stack._store(BookingRecord(*booking))
+                else:
+                    stack.push(*booking)
+            return stack
+        return build
+
+    def columns(priorities):
+        def build(count):
+            store = BookingColumns()
+            for booking in make_bookings(count, priorities):
+                store.append(*booking)
+            return store
+        return build
+
+    def catalog(count):
+        tree = Tree("Bookings")
+        for booking in make_bookings(count):
+            tree.add_node(tree.root, booking[0])
+        return tree
+
+    return [
+        ("Stack (2.py)", "tuple", stack(False)),
+        ("Stack (2.py)", "BookingRecord", stack(True)),
+        ("BalancedBinaryTree (2.py)", "dict nodes, tuple keys", with_class(trees, "AVLNode", DictAVLNode, tree(False))),
+        ("BalancedBinaryTree (2.py)", "slots nodes, tuple keys", tree(False)),
+        ("BalancedBinaryTree (2.py)", "slots nodes, BookingRecord keys", tree(True)),
+        ("CircularQueue (3.py)", "tuple", queue(False)),
+        ("CircularQueue (3.py)", "BookingRecord", queue(True)),
+        ("LinkedList (4.py)", "dict nodes", with_class(linked_list_module, "Node", DictListNode, linked_list)),
+        ("LinkedList (4.py)", "slots nodes", linked_list),
+        ("BookingStack (5.py)", "tuple", booking_stack(BookingStack, False, False)),
+        ("BookingStack (5.py)", "BookingRecord", booking_stack(BookingStack, False, True)),
+        ("BookingStack (5.py)", "BookingColumns", columns(False)),
+        ("Tree (6.py)", "dict nodes", with_class(catalog_module, "TreeNode", DictCatalogNode, catalog)),
+        ("Tree (6.py)", "slots nodes", catalog),
+        ("BookingStack (7.py)", "tuple", booking_stack(PriorityBookingStack, True, False)),
+        ("BookingStack (7.py)", "BookingRecord", booking_stack(PriorityBookingStack, True, True)),
+        ("BookingStack (7.py)", "BookingColumns", columns(True)),
+    ]
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Bytes per booking for every booking structure.")
+    parser.add_argument("--count", type=int, default=100_000, help="bookings per structure")
+    args = parser.parse_args()
+
+    print(f"{'Structure':<28}{'Representation':<34}{'Bytes/booking':>14}")
+    for structure, representation, build in cases():
+        print(f"{structure:<28}{representation:<34}{measure(build, args.count):>14.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,290 @@
+import argparse
+import json
+import os
+import platform
+import random
+import sys
+import time
+
+from benchmarks.common import ROOT, make_bookings
+from booking_core.catalog import Tree
+from booking_core.linked_list import LinkedList
+from booking_core.queues import CircularQueue
+from booking_core.sorting import _numpy
+from booking_core.stacks import BookingStack, PriorityBookingStack, Stack
+from booking_core.trees import BalancedBinaryTree, BinaryTree
+
+BASELINE_PATH = os.path.join(ROOT, "benchmarks", "baseline.json")
+SIZES = [1_000, 10_000, 100_000, 1_000_000]
+REGRESSION = 1.25  # Slower than the baseline by more than this is flagged
+BLOW_UP = 3.0  # Per-item cost growing more than this per 10x items is flagged
+
+
+# Each case: setup(n) builds the input for n items and returns the callable
+# that is timed. Results are nanoseconds per item.
+def stack_push(n):
+    bookings = list(make_bookings(n))
+
+    def run():
+        stack = Stack()
+        for booking in bookings:
+            stack.push(booking)
+
+    return run
+
+
+def stack_pop(n):
+    stack = Stack()
+    stack.stack = list(make_bookings(n))
+
+    def run():
+        for _ in range(n):
+            stack.pop()
+
+    return run
+
+
+def binary_tree_insert(n):
+    # Shuffled, since sorted input turns the unbalanced tree into a list
+    bookings = list(make_bookings(n))
+    random.Random(n).shuffle(bookings)
+
+    def run():
+        tree = BinaryTree()
+        for booking in bookings:
+            tree.insert(booking)
+
+    return run
+
+
+def balanced_tree_insert(n):
+    bookings = list(make_bookings(n))
+
+    def run():
+        tree = BalancedBinaryTree()
+        for booking in bookings:
+            tree.insert(booking)
+
+    return run
+
+
+def queue_enqueue(n):
+    bookings = list(make_bookings(n))
+
+    def run():
+        queue = CircularQueue(n)
+        for booking in bookings:
+            queue.enqueue(booking)
+
+    return run
+
+
+def queue_dequeue(n):
+    queue = CircularQueue(n)
+    queue.enqueue_many(make_bookings(n))
+
+    def run():
+        for _ in range(n):
+            queue.dequeue()
+
+    return run
+
+
+def queue_display(n):
+    queue = CircularQueue(n)
+    queue.enqueue_many(make_bookings(n))
+    for _ in range(n // 2):
+        queue.enqueue(queue.dequeue())  # Wrap the ring so display joins two slices
+    return queue.display
+
+
+def linked_list_add(n):
+    bookings = list(make_bookings(n))
+
+    def run():
+        bookings_list = LinkedList(max_size=n)
+        for booking in bookings:
+            bookings_list.add_booking(*booking)
+
+    return run
+
+
+def linked_list_display(n):
+    bookings_list = LinkedList(max_size=n)
+    for booking in make_bookings(n):
+        bookings_list.add_booking(*booking)
+    return bookings_list.display
+
+
+def booking_stack_push(n):
+    bookings = list(make_bookings(n))
+
+    def run():
+        stack = BookingStack(max_size=n)
+        for booking in bookings:
+            stack.push(*booking)
+
+    return run
+
+
+def booking_stack_pop(n):
+    stack = BookingStack(max_size=n)
+    stack.stack = list(make_bookings(n))
+
+    def run():
+        for _ in range(n):
+            stack.pop()
+
+    return run
+
+
+def tree_add_node(n):
+    names = [booking[0] for booking in make_bookings(n)]
+
+    def run():
+        # 100 children per node, so paths stay a few names long
+        tree = Tree("Bookings")
+        nodes = [tree.root]
+        for index, name in enumerate(names):
+            nodes.append(tree.add_node(nodes[index // 100], name))
+
+    return run
+
+
+def tree_add_node_chain(n):
+    # Each node under the previous one: the deepest catalog, where any
+    # per-depth cost in add_node shows up
+    names = [booking[0] for booking in make_bookings(n)]
+
+    def run():
+        tree = Tree("Bookings")
+        node = tree.root
+        for name in names:
+            node = tree.add_node(node, name)
+
+    return run
+
+
+def bucket_sort(n):
+    bookings = list(make_bookings(n, priorities=True))
+    random.Random(n).shuffle(bookings)
+    stack = PriorityBookingStack(max_size=n)
+    _numpy()  # Import the optional NumPy here, not inside the timed run
+
+    def run():
+        stack.stack = list(bookings)
+        stack.bucket_sort()
+
+    return run
+
+
+CASES = {
+    "Stack.push (2.py)": stack_push,
+    "Stack.pop (2.py)": stack_pop,
+    "BinaryTree.insert (2.py)": binary_tree_insert,
+    "BalancedBinaryTree.insert (2.py)": balanced_tree_insert,
+    "CircularQueue.enqueue (3.py)": queue_enqueue,
+    "CircularQueue.dequeue (3.py)": queue_dequeue,
+    "CircularQueue.display (3.py)": queue_display,
+    "LinkedList.add_booking (4.py)": linked_list_add,
+    "LinkedList.display (4.py)": linked_list_display,
+    "BookingStack.push (5.py)": booking_stack_push,
+    "BookingStack.pop (5.py)": booking_stack_pop,
+    "Tree.add_node (6.py)": tree_add_node,
+    "Tree.add_node deep chain (6.py)": tree_add_node_chain,
+    "BookingStack.bucket_sort (7.py)": bucket_sort,
+}
+
+
+def measure(setup, n, repeat):
+    """Best of repeat runs, in nanoseconds per item; setup is not timed."""
+    best = None
+    for _ in range(repeat):
+        run = setup(n)
+        start = time.perf_counter_ns()
+        run()
+        elapsed = time.perf_counter_ns() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return best / n
+
+
+def run_suite(sizes, repeat, only=None):
+    results = {}
+    for name, setup in CASES.items():
+        if only and not any(word.lower() in name.lower() for word in only):
+            continue
+        results[name] = {}
+        setup(min(sizes))()  # Untimed warm-up: first-call imports and caches
+        for n in sizes:
+            # Big sizes take long enough that one run is steady
+            results[name][str(n)] = round(measure(setup, n, repeat if n <= 10_000 else 1), 1)
+            print(f"{name:<36}{n:>10,}{results[name][str(n)]:>12.1f} ns/item", file=sys.stderr)
+    return {
+        "python": platform.python_version(),
+        "machine": platform.machine(),
+        "sizes": sizes,
+        "results": results,
+    }
+
+
+def compare(report, baseline, threshold=REGRESSION):
+    """Lines for a human, plus whether anything regressed against the baseline."""
+    lines = [f"{'Case':<36}{'Items':>10}{'ns/item':>10}{'baseline':>10}{'ratio':>8}  notes"]
+    regressed = False
+    for name, timings in report["results"].items():
+        previous = None
+        for size, ns in timings.items():
+            notes = []
+            base = baseline.get("results", {}).get(name, {}).get(size) if baseline else None
+            ratio = ns / base if base else None
+            if ratio is not None and ratio > threshold:
+                notes.append("REGRESSION")
+                regressed = True
+            if previous is not None and ns > previous * BLOW_UP:
+                notes.append(f"per-item cost x{ns / previous:.1f} since the last size")
+            previous = ns
+            lines.append(
+                f"{name:<36}{int(size):>10,}{ns:>10.1f}"
+                f"{base if base is not None else '-':>10}"
+                f"{f'{ratio:.2f}' if ratio is not None else '-':>8}  {', '.join(notes)}"
+            )
+    return lines, regressed
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Time every booking structure across growing sizes.")
+    parser.add_argument("--sizes", type=int, nargs="+", default=SIZES)
+    parser.add_argument("--repeat", type=int, default=3, help="best of this many runs for the small sizes")
+    parser.add_argument("--only", nargs="+", help="run only the cases whose name contains one of these")
+    parser.add_argument("--output", help="write the JSON report here instead of stdout")
+    parser.add_argument("--baseline", default=BASELINE_PATH, help="JSON report to compare against")
+    parser.add_argument("--save-baseline", action="store_true", help="store this run as the new baseline")
+    parser.add_argument("--threshold", type=float, default=REGRESSION)
+    args = parser.parse_args()
+
+    report = run_suite(args.sizes, args.repeat, args.only)
+
+    text = json.dumps(report, indent=2)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as output:
+            output.write(text + "\n")
+    else:
+        print(text)
+
+    baseline = None
+    if os.path.exists(args.baseline):
+        with open(args.baseline, encoding="utf-8") as baseline_file:
+            baseline = json.load(baseline_file)
+    lines, regressed = compare(report, baseline, args.threshold)
+    print("\n".join(lines), file=sys.stderr)
+
+    if args.save_baseline:
+        with open(args.baseline, "w", encoding="utf-8") as baseline_file:
+            baseline_file.write(text + "\n")
+        print(f"Saved baseline to {args.baseline}", file=sys.stderr)
+        return 0
+    return 1 if regressed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1 @@
+# Shared, GUI-free building blocks for the booking apps (2.py - 7.py)
@@ -0,0 +1,160 @@
+import os
+from collections import deque
+from itertools import count
+
+# catalog.json sits at the repository root, next to the app scripts
+CATALOG_PATH = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "catalog.json")
+
+
+def destination_names(path=CATALOG_PATH):
+    """Names of the bookable destinations: the leaves under "Destinations"."""
+    import json  # Here rather than at the top: json and re are half the package's import time
+
+    with open(path, encoding="utf-8") as catalog_file:
+        data = json.load(catalog_file)
+
+    names = []
+    pending = [entry for entry in data.get("children", []) if entry["name"] == "Destinations"]
+    while pending:
+        entry = pending.pop()
+        children = entry.get("children", [])
+        if children:
+            pending.extend(reversed(children))
+        elif entry["name"] != "Destinations":
+            names.append(entry["name"])
+    return names
+
+
+# TreeNode class to represent each node in the tree
+class TreeNode:
+    __slots__ = ("data", "children", "node_id", "parent")
+
+    def __init__(self, data, node_id=0, parent=None):
+        self.data = data
+        self.children = []
+        self.node_id = node_id  # Stable and unique within its Tree; used as the Treeview iid
+        self.parent = parent
+
+    def add_child(self, child_node):
+        child_node.parent = self
+        self.children.append(child_node)
+
+
+# Tree class to represent the tree structure, with name and child indexes.
+# Paths are looked up one level at a time through (parent id, name), so no
+# node stores its full path and adding or moving a node is independent of depth.
+class Tree:
+    def __init__(self, root_data):
+        self.ids = count()
+        self.root = TreeNode(root_data, next(self.ids))
+        self.nodes = {self.root.node_id: self.root}  # node_id -> node
+        self.by_name = {}  # name -> nodes with that name, in insertion order
+        self.by_child = {}  # (parent node_id, name) -> first child with that name
+
+    def add_node(self, parent_node, node_data):
+        new_node = TreeNode(node_data, next(self.ids))
+        parent_node.add_child(new_node)
+        self.nodes[new_node.node_id] = new_node
+        self.by_name.setdefault(node_data, []).append(new_node)
+        self.by_child.setdefault((parent_node.node_id, node_data), new_node)
+        return new_node
+
+    def get(self, node_id):
+        return self.nodes.get(node_id)
+
+    def find(self, name):
+        nodes = self.by_name.get(name)
+        return nodes[0] if nodes else None
+
+    def find_all(self, name):
+        return list(self.by_name.get(name, []))
+
+    def find_by_path(self, *names):
+        node = self.root
+        for name in names:
+            node = self.by_child.get((node.node_id, name))
+            if node is None:
+                return None
+        return node
+
+    def path(self, node):
+        names = []
+        while node.parent is not None:
+            names.append(node.data)
+            node = node.parent
+        return tuple(reversed(names))
+
+    def move_node(self, node, new_parent):
+        """Re-parent node (with its subtree) under new_parent."""
+        ancestor = new_parent
+        while ancestor is not None:
+            if ancestor is node:
+                return "Cannot move a node under itself"
+            ancestor = ancestor.parent
+
+        # Only node's own entry changes; its subtree is indexed by node_id
+        old_parent = node.parent
+        old_parent.children.remove(node)
+        key = (old_parent.node_id, node.data)
+        if self.by_child.get(key) is node:
+            del self.by_child[key]
+            for sibling in old_parent.children:
+                if sibling.data == node.data:
+                    self.by_child[key] = sibling  # The next one with that name takes over
+                    break
+
+        new_parent.add_child(node)
+        self.by_child.setdefault((new_parent.node_id, node.data), node)
+        return node
+
+    def dfs(self, start=None):
+        """Iterative pre-order depth-first walk, yielding start first."""
+        stack = [start or self.root]
+        while stack:
+            node = stack.pop()
+            yield node
+            stack.extend(reversed(node.children))
+
+    def bfs(self, start=None):
+        """Iterative breadth-first walk, level by level."""
+        queue = deque([start or self.root])
+        while queue:
+            node = queue.popleft()
+            yield node
+            queue.extend(node.children)
+
+    def display(self, parent_node, tree_view, parent_item=""):
+        """Display the whole subtree in the Treeview widget without recursion."""
+        pending = [(child, parent_item) for child in reversed(parent_node.children)]
+        while pending:
+            node, parent = pending.pop()
+            item = tree_view.insert(parent, "end", text=node.data, iid=node.node_id)
+            pending.extend((child, item) for child in reversed(node.children))
+
+    def display_children(self, parent_node, tree_view, parent_item=""):
+        """Insert only the direct children; deeper levels are added when opened."""
+        for child in parent_node.children:
+            item = tree_view.insert(parent_item, "end", text=child.data, iid=child.node_id)
+            if child.children:
+                # Placeholder so the node shows an expand arrow
+                tree_view.insert(item, "end", text="Loading...")
+
+
+def load_catalog(path):
+    """Build the Tree and the name -> details registry from a JSON catalog file."""
+    import json
+
+    with open(path, encoding="utf-8") as catalog_file:
+        data = json.load(catalog_file)
+
+    tree = Tree(data["name"])
+    details = {}
+    pending = [(tree.root, data)]
+    while pending:
+        node, entry = pending.pop()
+        for child in entry.get("children", []):
+            child_node = tree.add_node(node, child["name"])
+            if "details" in child:
+                details[child["name"]] = child["details"]
+            pending.append((child_node, child))
+    return tree, details
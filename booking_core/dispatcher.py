@@ -0,0 +1,103 @@
+from booking_core.sorting import PRIORITY
+
+
+# Priority Dispatcher: a binary min-heap of bookings (priority 1 is served
+# first) with an index map for O(log n) priority updates, and aging so that
+# low-priority bookings cannot wait forever.
+#
+# Aging: a booking's effective priority drops by aging_rate for every booking
+# that arrives after it. Since p - rate * (now - arrival) orders the same way
+# as p + rate * arrival at any moment, the heap key never has to change.
+class PriorityDispatcher:
+    def __init__(self, aging_rate=0.0):
+        self.aging_rate = aging_rate
+        self.clock = 0  # Counts arrivals
+        self.heap = []  # [key, handle] pairs
+        self.position = {}  # handle -> index in self.heap
+        self.entries = {}  # handle -> [booking, priority, arrival]
+
+    def __len__(self):
+        return len(self.heap)
+
+    def push(self, booking, priority=None):
+        """Add a booking and return its handle for later priority updates."""
+        if priority is None:
+            priority = booking[PRIORITY]
+        self.clock += 1
+        handle = self.clock
+        self.entries[handle] = [booking, priority, self.clock]
+        self.heap.append([self._key(priority, self.clock), handle])
+        self.position[handle] = len(self.heap) - 1
+        self._sift_up(len(self.heap) - 1)
+        return handle
+
+    def pop(self):
+        if not self.heap:
+            return "No bookings to dispatch"
+        return self._remove_at(0)
+
+    def peek(self):
+        if not self.heap:
+            return "No bookings to dispatch"
+        return self.entries[self.heap[0][1]][0]
+
+    def update_priority(self, handle, priority):
+        # Decrease-key (or increase) keeping the booking's original arrival for aging
+        if handle not in self.entries:
+            return "Booking not found"
+        entry = self.entries[handle]
+        entry[1] = priority
+        index = self.position[handle]
+        self.heap[index][0] = self._key(priority, entry[2])
+        self._sift_up(index)
+        self._sift_down(self.position[handle])
+
+    def remove(self, handle):
+        if handle not in self.entries:
+            return "Booking not found"
+        return self._remove_at(self.position[handle])
+
+    def _key(self, priority, arrival):
+        return priority + self.aging_rate * arrival
+
+    def _remove_at(self, index):
+        handle = self.heap[index][1]
+        last = self.heap.pop()
+        if index < len(self.heap):
+            self.heap[index] = last
+            self.position[last[1]] = index
+            self._sift_up(index)
+            self._sift_down(self.position[last[1]])
+        del self.position[handle]
+        return self.entries.pop(handle)[0]
+
+    def _sift_up(self, index):
+        heap, position = self.heap, self.position
+        node = heap[index]
+        while index > 0:
+            parent = (index - 1) // 2
+            if heap[parent] <= node:
+                break
+            heap[index] = heap[parent]
+            position[heap[index][1]] = index
+            index = parent
+        heap[index] = node
+        position[node[1]] = index
+
+    def _sift_down(self, index):
+        heap, position = self.heap, self.position
+        size = len(heap)
+        node = heap[index]
+        while True:
+            child = 2 * index + 1
+            if child >= size:
+                break
+            if child + 1 < size and heap[child + 1] < heap[child]:
+                child += 1
+            if node <= heap[child]:
+                break
+            heap[index] = heap[child]
+            position[heap[index][1]] = index
+            index = child
+        heap[index] = node
+        position[node[1]] = index
@@ -0,0 +1,203 @@
+import argparse
+import csv
+import json
+import os
+import sys
+import time
+from itertools import islice
+
+from booking_core.linked_list import LinkedList
+from booking_core.queues import CircularQueue
+from booking_core.sorting import HIGHEST_PRIORITY, LOWEST_PRIORITY
+from booking_core.stacks import BookingStack, PriorityBookingStack, Stack
+from booking_core.trees import BalancedBinaryTree
+from booking_core.validation import PHONE_ERROR, invalid_phones
+
+# Streaming bulk import of bookings from CSV or JSONL, without Tk:
+#
+#   python -m booking_core.importer bookings.csv --target queue
+#
+# Rows flow through generators (read -> parse -> batch -> validate -> load),
+# so only one batch is ever held outside the target structure.
+
+BATCH_SIZE = 10_000
+PROGRESS_EVERY = 100_000  # Rows between progress lines on stderr
+
+
+FIELDS = ("name", "phone", "booking", "priority")
+
+
+def read_records(stream, fmt):
+    """Yield (line number, raw values in FIELDS order) for every CSV or JSONL record."""
+    if fmt == "csv":
+        reader = csv.reader(stream)
+        header = [column.strip() for column in next(reader, [])]
+        columns = [header.index(field) if field in header else None for field in FIELDS]
+        for row in reader:
+            if row:
+                yield reader.line_num, [
+                    row[column] if column is not None and column < len(row) else None for column in columns
+                ]
+    else:
+        for line_number, line in enumerate(stream, 1):
+            if line.strip():
+                try:
+                    record = json.loads(line)
+                except ValueError:
+                    record = None
+                if isinstance(record, dict):
+                    yield line_number, [record.get(field) for field in FIELDS]
+                else:
+                    yield line_number, None
+
+
+def parse(records):
+    # Booking fields as stripped strings; a missing field becomes ""
+    for line_number, values in records:
+        if values is None:
+            yield line_number, None
+            continue
+        name, phone, booking, priority = values
+        yield line_number, (_text(name), _text(phone), _text(booking), _text(priority))
+
+
+def _text(value):
+    return "" if value is None else str(value).strip()
+
+
+def batches(rows, size=BATCH_SIZE):
+    rows = iter(rows)
+    while True:
+        batch = list(islice(rows, size))
+        if not batch:
+            return
+        yield batch
+
+
+def validate(row_batches, with_priority, on_reject):
+    """Yield each batch's bookings that pass the add_booking checks; report the rest.
+
+    Phones are checked a whole batch at a time with invalid_phones.
+    """
+    for batch in row_batches:
+        rows = [(line_number, row) for line_number, row in batch if row is not None and all(row[:3])]
+        if len(rows) < len(batch):
+            for line_number, row in batch:
+                if row is None:
+                    on_reject(line_number, "Not a valid record")
+                elif not all(row[:3]):
+                    on_reject(line_number, "Please fill out all fields.")
+
+        bad_phones = set(invalid_phones([row[1] for _, row in rows]))
+        bookings = []
+        for index, (line_number, (name, phone, booking, priority)) in enumerate(rows):
+            if index in bad_phones:
+                on_reject(line_number, PHONE_ERROR)
+            elif not with_priority:
+                bookings.append((name, phone, booking))
+            elif not priority:
+                on_reject(line_number, "Please fill out all fields.")
+            elif not priority.isdigit() or not LOWEST_PRIORITY <= int(priority) <= HIGHEST_PRIORITY:
+                on_reject(line_number, "Priority must be a number between 1 and 5.")
+            else:
+                bookings.append((name, phone, booking, int(priority)))
+        yield bookings
+
+
+def _load_each(method):
+    def load(structure, batch):
+        add = getattr(structure, method)
+        for booking in batch:
+            add(booking)
+
+    return load
+
+
+def _load_fields(method):
+    def load(structure, batch):
+        add = getattr(structure, method)
+        for booking in batch:
+            add(*booking)
+
+    return load
+
+
+# Target name -> (make an empty, unbounded structure, load one batch into it)
+TARGETS = {
+    "stack": (Stack, _load_each("push")),
+    "tree": (BalancedBinaryTree, _load_each("insert")),
+    "queue": (lambda: CircularQueue(BATCH_SIZE, growable=True), lambda queue, batch: queue.enqueue_many(batch)),
+    "list": (lambda: LinkedList(max_size=None), _load_fields("add_booking")),
+    "booking-stack": (lambda: BookingStack(max_size=None), _load_fields("push")),
+    "priority-stack": (lambda: PriorityBookingStack(max_size=None), _load_fields("push")),
+}
+
+
+class ImportReport:
+    def __init__(self, errors=None, max_errors=20):
+        self.loaded = 0
+        self.rejected = 0
+        self.errors = errors  # Stream for reject lines, or None
+        self.max_errors = max_errors
+        self.start = time.perf_counter()
+
+    def reject(self, line_number, reason):
+        self.rejected += 1
+        if self.errors is not None and self.rejected <= self.max_errors:
+            print(f"line {line_number}: {reason}", file=self.errors)
+
+    def elapsed(self):
+        return time.perf_counter() - self.start
+
+    def rows_per_second(self):
+        elapsed = self.elapsed()
+        return (self.loaded + self.rejected) / elapsed if elapsed else 0.0
+
+
+def import_bookings(stream, fmt, target, batch_size=BATCH_SIZE, report=None, progress=None):
+    """Stream bookings into a new structure of the given target type; returns (structure, report)."""
+    make, load = TARGETS[target]
+    structure = make()
+    report = report or ImportReport()
+    rows = parse(read_records(stream, fmt))
+    next_progress = PROGRESS_EVERY
+    for batch in validate(batches(rows, batch_size), target == "priority-stack", report.reject):
+        load(structure, batch)
+        report.loaded += len(batch)
+        if progress is not None and report.loaded >= next_progress:
+            print(f"{report.loaded:,} rows ({report.rows_per_second():,.0f} rows/s)", file=progress)
+            next_progress += PROGRESS_EVERY
+    return structure, report
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Bulk import bookings from CSV or JSONL without the GUI.")
+    parser.add_argument("path", help="CSV (with a name,phone,booking[,priority] header) or JSONL file; - for stdin")
+    parser.add_argument("--target", choices=sorted(TARGETS), default="queue")
+    parser.add_argument("--format", choices=["csv", "jsonl"], help="default: from the file extension")
+    parser.add_argument("--batch-size", type=int, default=BATCH_SIZE)
+    parser.add_argument("--quiet", action="store_true", help="no progress or reject lines")
+    args = parser.parse_args(argv)
+
+    fmt = args.format
+    if fmt is None:
+        fmt = "csv" if os.path.splitext(args.path)[1].lower() == ".csv" else "jsonl"
+
+    report = ImportReport(errors=None if args.quiet else sys.stderr)
+    progress = None if args.quiet else sys.stderr
+    if args.path == "-":
+        structure, report = import_bookings(sys.stdin, fmt, args.target, args.batch_size, report, progress)
+    else:
+        with open(args.path, newline="", encoding="utf-8") as stream:
+            structure, report = import_bookings(stream, fmt, args.target, args.batch_size, report, progress)
+
+    print(
+        f"Imported {report.loaded:,} bookings into {args.target} "
+        f"({report.rejected:,} rejected) in {report.elapsed():.2f} s, "
+        f"{report.rows_per_second():,.0f} rows/s"
+    )
+    return 0 if report.loaded else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,237 @@
+import functools
+import inspect
+import json
+import os
+import time
+import tracemalloc
+
+# Opt-in instrumentation: Instruments swaps timing wrappers into the classes
+# it is given and puts the original methods back on uninstall. Nothing is
+# wrapped until install is called, so the cost when disabled is zero.
+
+SUB_BUCKETS = 16  # Buckets per power of two: values land within 1/16 (~6%) of their bucket
+
+# BookingApp methods worth timing besides the update_*_table / fill_*_table refreshes
+APP_HANDLERS = {
+    "add_booking", "add_or_replace_booking", "remove_booking", "cancel_booking",
+    "sort_bookings", "on_item_select", "on_item_open", "find_bookings",
+    "undo_action", "redo_action", "add_to_history", "update_suggestions",
+}
+
+
+# HDR-style latency histogram: log-linear buckets, so small and large
+# latencies keep the same relative precision in a few hundred counters
+class LatencyHistogram:
+    def __init__(self):
+        self.counts = {}  # bucket index -> count, only the buckets used
+        self.count = 0
+        self.total = 0
+        self.min = None
+        self.max = 0
+
+    def record(self, value):
+        index = bucket_index(value)
+        self.counts[index] = self.counts.get(index, 0) + 1
+        self.count += 1
+        self.total += value
+        if self.min is None or value < self.min:
+            self.min = value
+        if value > self.max:
+            self.max = value
+
+    def mean(self):
+        return self.total / self.count if self.count else 0
+
+    def percentile(self, percent):
+        """Lower bound of the bucket holding the given percentile (0-100)."""
+        if not self.count:
+            return 0
+        rank = percent / 100 * self.count
+        seen = 0
+        for index in sorted(self.counts):
+            seen += self.counts[index]
+            if seen >= rank:
+                return bucket_lower_bound(index)
+        return self.max
+
+    def buckets(self):
+        return {bucket_lower_bound(index): self.counts[index] for index in sorted(self.counts)}
+
+
+def bucket_index(value):
+    # Below 2 * SUB_BUCKETS every value has its own bucket; above, the top
+    # five bits pick the bucket within each power of two
+    if value < 2 * SUB_BUCKETS:
+        return max(0, value)
+    shift = value.bit_length() - 5
+    return (shift << 4) + (value >> shift)
+
+
+def bucket_lower_bound(index):
+    if index < 2 * SUB_BUCKETS:
+        return index
+    return ((index & 15) | 16) << ((index >> 4) - 1)
+
+
+class OperationStats:
+    __slots__ = ("calls", "latency", "allocated")
+
+    def __init__(self):
+        self.calls = 0
+        self.latency = LatencyHistogram()  # Nanoseconds
+        self.allocated = 0  # Net bytes, when allocations are tracked
+
+    def record(self, elapsed, allocated=0):
+        self.calls += 1
+        self.latency.record(elapsed)
+        self.allocated += allocated
+
+
+class Instruments:
+    def __init__(self, track_allocations=False):
+        self.stats = {}  # "Class.method" -> OperationStats
+        self.patched = []  # (class, name, original) to put back on uninstall
+        self.track_allocations = track_allocations  # tracemalloc is slow; off unless asked for
+        if track_allocations and not tracemalloc.is_tracing():
+            tracemalloc.start()
+
+    def install(self, owner, names=None):
+        """Time the public methods of a class (or just the given names)."""
+        for name, function in list(vars(owner).items()):
+            if names is None and name.startswith("_"):
+                continue
+            if names is not None and name not in names:
+                continue
+            if not inspect.isfunction(function):
+                continue
+            if inspect.iscoroutinefunction(function) or inspect.isgeneratorfunction(function):
+                continue  # Calling these only builds the coroutine or generator
+            setattr(owner, name, self._wrap(f"{owner.__name__}.{name}", function))
+            self.patched.append((owner, name, function))
+
+    def install_structures(self):
+        # Imported here so importing this module stays cheap
+        from booking_core.catalog import Tree
+        from booking_core.dispatcher import PriorityDispatcher
+        from booking_core.linked_list import IndexedLinkedList, LinkedList
+        from booking_core.persistent_stack import PersistentBookingStack
+        from booking_core.queues import BlockingCircularQueue, CircularQueue
+        from booking_core.stacks import BookingStack, PriorityBookingStack, Stack
+        from booking_core.trees import BalancedBinaryTree, BinaryTree
+        from booking_core.trie import Trie
+
+        for structure in (
+            Stack, BookingStack, PriorityBookingStack, PersistentBookingStack,
+            BinaryTree, BalancedBinaryTree, CircularQueue, BlockingCircularQueue,
+            LinkedList, IndexedLinkedList, Tree, PriorityDispatcher, Trie,
+        ):
+            self.install(structure)
+
+    def install_app(self, app_class):
+        """Time the event handlers and table refreshes of a BookingApp class."""
+        self.install(app_class, {
+            name for name in vars(app_class)
+            if name in APP_HANDLERS or (name.endswith("_table") and not name.startswith("_"))
+        })
+
+    def uninstall(self):
+        while self.patched:
+            owner, name, function = self.patched.pop()
+            setattr(owner, name, function)
+
+    def _wrap(self, label, function):
+        stats = self.stats.setdefault(label, OperationStats())
+        clock = time.perf_counter_ns
+
+        if self.track_allocations:
+            traced = tracemalloc.get_traced_memory
+
+            @functools.wraps(function)
+            def timed(*args, **kwargs):
+                before = traced()[0]
+                start = clock()
+                try:
+                    return function(*args, **kwargs)
+                finally:
+                    stats.record(clock() - start, traced()[0] - before)
+        else:
+
+            @functools.wraps(function)
+            def timed(*args, **kwargs):
+                start = clock()
+                try:
+                    return function(*args, **kwargs)
+                finally:
+                    stats.record(clock() - start)
+
+        return timed
+
+    def snapshot(self):
+        """Counters and latency summary (nanoseconds) for every operation called so far."""
+        report = {}
+        for label, stats in sorted(self.stats.items()):
+            if not stats.calls:
+                continue
+            latency = stats.latency
+            report[label] = {
+                "calls": stats.calls,
+                "mean_ns": round(latency.mean()),
+                "p50_ns": latency.percentile(50),
+                "p90_ns": latency.percentile(90),
+                "p99_ns": latency.percentile(99),
+                "max_ns": latency.max,
+                "allocated_bytes": stats.allocated if self.track_allocations else None,
+                "histogram": latency.buckets(),
+            }
+        return report
+
+    def dump(self, path):
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        with open(path, "w", encoding="utf-8") as stats_file:
+            json.dump({"taken_at": time.time(), "operations": self.snapshot()}, stats_file, indent=2)
+
+
+# Live Stats Panel: a window listing every instrumented operation, refreshed
+# every interval milliseconds
+class StatsPanel:
+    def __init__(self, root, instruments, interval=1000):
+        from tkinter import ttk
+        import tkinter as tk
+
+        from booking_core.table_sync import TreeviewSync
+
+        self.instruments = instruments
+        self.interval = interval
+        self.window = tk.Toplevel(root)
+        self.window.title("Booking Stats")
+        self.window.geometry("820x400")
+
+        columns = ("Operation", "Calls", "Mean (µs)", "p50 (µs)", "p99 (µs)", "Max (µs)", "Allocated (KB)")
+        tree = ttk.Treeview(self.window, columns=columns, show="headings")
+        for column in columns:
+            tree.heading(column, text=column)
+            tree.column(column, width=90, anchor="e")
+        tree.column("Operation", width=260, anchor="w")
+        tree.pack(fill="both", expand=True)
+        self.view = TreeviewSync(tree)
+        self.refresh()
+
+    def refresh(self):
+        if not self.window.winfo_exists():
+            return  # Closed by the user
+        rows = []
+        for label, stats in self.instruments.snapshot().items():
+            allocated = stats["allocated_bytes"]
+            rows.append((
+                label,
+                stats["calls"],
+                f"{stats['mean_ns'] / 1000:.1f}",
+                f"{stats['p50_ns'] / 1000:.1f}",
+                f"{stats['p99_ns'] / 1000:.1f}",
+                f"{stats['max_ns'] / 1000:.1f}",
+                "-" if allocated is None else f"{allocated / 1024:.1f}",
+            ))
+        self.view.sync(rows)
+        self.window.after(self.interval, self.refresh)
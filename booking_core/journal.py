@@ -0,0 +1,332 @@
+import gc
+import json
+import os
+import pickle
+import threading
+from array import array
+
+from booking_core.linked_list import LinkedList, Node
+from booking_core.persistent_stack import Cons, PersistentBookingStack
+from booking_core.queues import CircularQueue
+from booking_core.stacks import BookingStack, PriorityBookingStack, Stack
+from booking_core.trees import BalancedBinaryTree
+
+# Durability for the in-memory structures: every mutation is appended to a
+# write-ahead log, and the whole structure is written out as a snapshot every
+# so often. On startup the snapshot is loaded and the log after it replayed.
+#
+#   bookings.snapshot  pickled {"seq", "columns"} (or {"seq", "bookings"} for
+#                      anything that is not uniform booking tuples), replaced atomically
+#   bookings.log       one JSON line per mutation: [seq, method, args]
+
+FSYNC_INTERVAL = 0.05  # Seconds a mutation may wait to be committed with others
+GROUP_SIZE = 1000  # Commit straight away once this many mutations are waiting
+SNAPSHOT_EVERY = 100_000  # Mutations between snapshots
+
+# Methods that change a structure; calls to them are logged and replayed
+MUTATIONS = {
+    "push", "pop", "insert", "delete", "load_sorted",
+    "enqueue", "dequeue", "enqueue_many", "dequeue_many", "replace",
+    "add_booking", "remove_booking", "remove_by_phone", "remove_last", "move_to_front",
+    "bucket_sort", "undo", "redo", "restore", "restore_bookings",
+}
+
+
+# Write-Ahead Log with group commit: appends are buffered and written (and
+# fsynced) together, at most fsync_interval seconds after the first of them
+class Journal:
+    def __init__(self, directory, fsync_interval=FSYNC_INTERVAL, group_size=GROUP_SIZE):
+        os.makedirs(directory, exist_ok=True)
+        self.log_path = os.path.join(directory, "bookings.log")
+        self.snapshot_path = os.path.join(directory, "bookings.snapshot")
+        self.fsync_interval = fsync_interval  # 0 commits every mutation on its own
+        self.group_size = group_size
+        self.seq = 0  # Sequence number of the last logged mutation
+        self.since_snapshot = 0
+        self.pending = []
+        self.lock = threading.Lock()
+        self.timer = None
+        self.log = None
+
+    def recover(self):
+        """Read back (snapshot bookings or None, [(method, args), ...] logged after it)."""
+        bookings = None
+        snapshot_seq = 0
+        if os.path.exists(self.snapshot_path):
+            with open(self.snapshot_path, "rb") as snapshot:
+                state = pickle.load(snapshot)
+            bookings = _unpack(state["columns"]) if "columns" in state else state["bookings"]
+            snapshot_seq = self.seq = state["seq"]
+
+        mutations = []
+        good_length = 0
+        if os.path.exists(self.log_path):
+            with open(self.log_path, "rb") as log:
+                for line in log:
+                    try:
+                        seq, method, args = json.loads(line)
+                    except ValueError:
+                        break  # A torn write from a crash; nothing after it was committed
+                    good_length += len(line)
+                    if seq > snapshot_seq:
+                        mutations.append((method, _tuples(args)))
+                        self.seq = seq
+
+        self.since_snapshot = len(mutations)
+        self.log = open(self.log_path, "ab")
+        self.log.truncate(good_length)
+        return bookings, mutations
+
+    def append(self, method, args):
+        line = json.dumps([self.seq + 1, method, args], separators=(",", ":")).encode() + b"\n"
+        with self.lock:
+            self.seq += 1
+            self.since_snapshot += 1
+            self.pending.append(line)
+            if self.fsync_interval == 0 or len(self.pending) >= self.group_size:
+                self._commit()
+            elif self.timer is None:
+                self.timer = threading.Timer(self.fsync_interval, self.commit)
+                self.timer.daemon = True
+                self.timer.start()
+
+    def commit(self):
+        with self.lock:
+            self._commit()
+
+    def _commit(self):
+        if self.timer is not None:
+            self.timer.cancel()
+            self.timer = None
+        if not self.pending:
+            return
+        self.log.write(b"".join(self.pending))
+        self.log.flush()
+        os.fsync(self.log.fileno())
+        self.pending.clear()
+
+    def write_snapshot(self, bookings):
+        # Write beside the old snapshot and swap it in, then start a fresh log
+        with self.lock:
+            self._commit()
+            temporary = self.snapshot_path + ".tmp"
+            columns = _pack(bookings)
+            if columns is None:
+                state = {"seq": self.seq, "bookings": bookings}
+            else:
+                state = {"seq": self.seq, "columns": columns}
+            with open(temporary, "wb") as snapshot:
+                pickle.dump(state, snapshot, pickle.HIGHEST_PROTOCOL)
+                snapshot.flush()
+                os.fsync(snapshot.fileno())
+            os.replace(temporary, self.snapshot_path)
+            self.log.truncate(0)
+            self.since_snapshot = 0
+
+    def close(self):
+        if self.log is not None:
+            self.commit()
+            self.log.close()
+            self.log = None
+
+
+# Durable structure: forwards everything to the structure it wraps, logging
+# the mutating calls. Meant for one thread, like the apps that use it.
+class Durable:
+    def __init__(self, structure, journal, snapshot_every=SNAPSHOT_EVERY):
+        self.structure = structure
+        self.journal = journal
+        self.snapshot_every = snapshot_every
+        self.dump, self.load = _snapshot_functions(structure)
+
+    def __len__(self):
+        return len(self.structure)
+
+    def __iter__(self):
+        return iter(self.structure)
+
+    def __getattr__(self, name):
+        attribute = getattr(self.structure, name)
+        if name not in MUTATIONS:
+            return attribute
+
+        def logged(*args):
+            if name in ("enqueue_many", "load_sorted"):
+                args = (list(args[0]),)
+            result = attribute(*args)
+            if name == "restore":
+                # A version is a chain of cells, not JSON; log the bookings it holds
+                self.journal.append("restore_bookings", (_cons_bookings(args[0]),))
+            else:
+                self.journal.append(name, args)
+            if self.journal.since_snapshot >= self.snapshot_every:
+                self.checkpoint()
+            return result
+
+        return logged
+
+    def recover(self):
+        # Recovery only builds objects, none of them garbage; the cyclic GC
+        # would otherwise rescan the growing heap over and over
+        collecting = gc.isenabled()
+        gc.disable()
+        try:
+            bookings, mutations = self.journal.recover()
+            if bookings is not None:
+                self.load(self.structure, bookings)
+            for name, args in mutations:
+                getattr(self.structure, name)(*args)
+        finally:
+            if collecting:
+                gc.enable()
+
+    def checkpoint(self):
+        self.journal.write_snapshot(self.dump(self.structure))
+        if isinstance(self.structure, PersistentBookingStack):
+            # Undo cannot reach back past a snapshot, since the log after it is replayed without that history
+            self.structure.undo_history.clear()
+            self.structure.redo_history.clear()
+
+    def close(self):
+        self.checkpoint()
+        self.journal.close()
+
+
+def open_durable(structure, directory, fsync_interval=FSYNC_INTERVAL, snapshot_every=SNAPSHOT_EVERY):
+    """Wrap an empty structure so it survives restarts, refilled from directory."""
+    durable = Durable(structure, Journal(directory, fsync_interval), snapshot_every)
+    durable.recover()
+    return durable
+
+
+def _load_stack(stack, bookings):
+    stack.stack = list(bookings)
+
+
+def _load_queue(queue, bookings):
+    queue._take_many(len(queue))
+    queue._store_many(bookings)
+
+
+def _load_list(bookings_list, bookings):
+    if type(bookings_list) is not LinkedList:
+        _load_each(bookings_list, bookings)  # IndexedLinkedList also keeps its phone index
+        return
+    # Link the nodes directly rather than one _store call each
+    tail = bookings_list.tail
+    count = 0
+    for booking in bookings:
+        node = Node(*booking)
+        if tail is None:
+            bookings_list.head = node
+        else:
+            tail.next = node
+        tail = node
+        count += 1
+    bookings_list.tail = tail
+    bookings_list.size += count
+
+
+def _load_priority_stack(stack, bookings):
+    if stack.by_priority is None:
+        _load_stack(stack, bookings)
+    else:
+        _load_each(stack, bookings)
+
+
+def _load_each(structure, bookings):
+    # _store keeps any extra bookkeeping (phone index, priority deques) up to date
+    for booking in bookings:
+        structure._store(booking)
+
+
+def _load_persistent(stack, bookings):
+    top = None
+    for booking in bookings:
+        top = Cons(booking, top)
+    stack.top = top
+    stack.undo_history.clear()
+    stack.redo_history.clear()
+
+
+def _cons_bookings(top):
+    # Bottom first, the order restore_bookings takes them in
+    bookings = []
+    while top is not None:
+        bookings.append(top.item)
+        top = top.rest
+    bookings.reverse()
+    return bookings
+
+
+def _snapshot_functions(structure):
+    # (bookings from the structure, load bookings into an empty one), by type
+    if isinstance(structure, (Stack, BookingStack)):
+        return (lambda stack: stack.stack), _load_stack
+    if isinstance(structure, PriorityBookingStack):
+        return (lambda stack: stack.stack), _load_priority_stack
+    if isinstance(structure, BalancedBinaryTree):
+        return list, BalancedBinaryTree.load_sorted
+    if isinstance(structure, CircularQueue):
+        return CircularQueue.display, _load_queue
+    if isinstance(structure, LinkedList):
+        return LinkedList.display, _load_list
+    if isinstance(structure, PersistentBookingStack):
+        return PersistentBookingStack.display, _load_persistent
+    raise TypeError(f"No snapshot format for {type(structure).__name__}")
+
+
+def _tuples(value):
+    # JSON turns the booking tuples into lists; turn them back
+    if isinstance(value, list):
+        return tuple(_tuples(item) for item in value)
+    return value
+
+
+def _pack(bookings):
+    """Booking tuples as columns: names and phones joined into one string each,
+    destinations as codes into their distinct values, priorities as an array.
+
+    Unpickling a few big objects and zipping them back is several times faster
+    than unpickling a million small tuples. Returns None for anything else.
+    """
+    bookings = list(bookings)
+    if not bookings or any(type(booking) is not tuple for booking in bookings):
+        return None
+    width = len(bookings[0])
+    if width not in (3, 4) or any(len(booking) != width for booking in bookings):
+        return None
+
+    columns = list(zip(*bookings))
+    if any(type(value) is not str for column in columns[:3] for value in column):
+        return None
+    names, phones = "\0".join(columns[0]), "\0".join(columns[1])
+    if names.count("\0") != len(bookings) - 1 or phones.count("\0") != len(bookings) - 1:
+        return None  # A separator inside a value
+
+    codes = {}
+    destinations = array("I", [codes.setdefault(destination, len(codes)) for destination in columns[2]])
+    priorities = None
+    if width == 4:
+        if any(type(priority) is not int for priority in columns[3]):
+            return None
+        priorities = array("q", columns[3])
+    return {
+        "names": names,
+        "phones": phones,
+        "destinations": list(codes),
+        "codes": destinations,
+        "priorities": priorities,
+    }
+
+
+def _unpack(columns):
+    destinations = columns["destinations"]
+    fields = [
+        columns["names"].split("\0"),
+        columns["phones"].split("\0"),
+        [destinations[code] for code in columns["codes"]],
+    ]
+    if columns["priorities"] is not None:
+        fields.append(columns["priorities"])
+    return list(zip(*fields))
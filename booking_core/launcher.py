@@ -0,0 +1,45 @@
+import sys
+
+# What the app scripts (2.py-7.py) share when run from the command line:
+# the --durable journal, the --stats instruments, and closing whatever the
+# app keeps on disk. tkinter is only imported once an app is run, so batch
+# jobs can import booking_core without it.
+
+
+def journaled(structure, directory):
+    """structure with every change logged in directory, refilled from it on start."""
+    from booking_core.journal import open_durable
+
+    return open_durable(structure, directory)
+
+
+def run_app(app_class, stats_path, **flags):
+    """Run app_class(root, **options) in a Tk window until it is closed.
+
+    flags maps each option to its command-line flag, e.g. durable="--durable".
+    --stats instruments the app and shows a live panel (--allocations also
+    counts memory), written to stats_path on exit. app.store, when the app
+    sets one, is closed after the window is.
+    """
+    import tkinter as tk
+
+    instruments = None
+    if "--stats" in sys.argv:
+        from booking_core.instrumentation import Instruments, StatsPanel
+
+        # Wrap before the app is built, since buttons bind their handlers on creation
+        instruments = Instruments(track_allocations="--allocations" in sys.argv)
+        instruments.install_structures()
+        instruments.install_app(app_class)
+
+    root = tk.Tk()
+    app = app_class(root, **{option: flag in sys.argv for option, flag in flags.items()})
+    if instruments is not None:
+        StatsPanel(root, instruments)
+    root.mainloop()
+    store = getattr(app, "store", None)
+    if store is not None:
+        store.close()  # Final snapshot, pending inserts or a flush of the ring, so the next start only loads it
+    if instruments is not None:
+        instruments.dump(stats_path)
+    return app
@@ -0,0 +1,176 @@
+# Linked List Node
+class Node:
+    __slots__ = ("name", "phone", "booking", "next")
+
+    def __init__(self, name, phone, booking):
+        self.name = name
+        self.phone = phone
+        self.booking = booking
+        self.next = None
+
+# Doubly Linked List Node
+class DoublyNode(Node):
+    __slots__ = ("prev",)
+
+    def __init__(self, name, phone, booking):
+        super().__init__(name, phone, booking)
+        self.prev = None
+
+# Linked List Class
+class LinkedList:
+    def __init__(self, max_size=3, overflow=None):
+        self.head = None
+        self.tail = None
+        self.size = 0
+        self.max_size = max_size
+        self.overflow = overflow  # Optional booking_core.overflow policy for a full list
+
+    def __len__(self):
+        return self.size
+
+    def is_full(self):
+        return self.size == self.max_size
+
+    def add_booking(self, name, phone, booking):
+        if self.overflow is not None:
+            return self.overflow.add(self, (name, phone, booking))
+        return self._store((name, phone, booking))
+
+    def remove_booking(self):
+        if self.overflow is not None:
+            return self.overflow.remove(self, self._take)
+        return self._take()
+
+    def _store(self, item):
+        if self.is_full():
+            return "List is full. Cannot add more bookings."
+        
+        new_node = Node(*item)
+        
+        if self.head is None:
+            self.head = self.tail = new_node
+        else:
+            self.tail.next = new_node
+            self.tail = new_node
+
+        self.size += 1
+        return "Booking added successfully"
+
+    def _evict_oldest(self):
+        return self._take()
+
+    def _take(self):
+        if self.head is None:
+            return "No bookings to remove"
+        
+        # Remove the first booking (head of the list)
+        removed_booking = self.head
+        self.head = self.head.next
+        self.size -= 1
+        
+        if self.head is None:  # List is now empty
+            self.tail = None
+
+        return removed_booking
+
+    def display(self):
+        bookings = []
+        current = self.head
+        while current:
+            bookings.append((current.name, current.phone, current.booking))
+            current = current.next
+        return bookings
+
+    def get_range(self, start, stop):
+        # Bookings at positions [start, stop); walks from the head
+        bookings = []
+        current = self.head
+        index = 0
+        while current and index < stop:
+            if index >= start:
+                bookings.append((current.name, current.phone, current.booking))
+            current = current.next
+            index += 1
+        return bookings
+
+
+# Indexed Linked List: doubly linked, with a phone -> node dict so any booking
+# can be found, removed or moved to the front in O(1)
+class IndexedLinkedList(LinkedList):
+    def __init__(self, max_size=3, overflow=None):
+        super().__init__(max_size, overflow)
+        self.index = {}
+
+    def __contains__(self, phone):
+        return phone in self.index
+
+    def get(self, phone):
+        node = self.index.get(phone)
+        if node is None:
+            return None
+        return (node.name, node.phone, node.booking)
+
+    def _store(self, item):
+        if self.is_full():
+            return "List is full. Cannot add more bookings."
+        if item[1] in self.index:
+            return "A booking with this phone number already exists."
+
+        new_node = DoublyNode(*item)
+        if self.head is None:
+            self.head = self.tail = new_node
+        else:
+            new_node.prev = self.tail
+            self.tail.next = new_node
+            self.tail = new_node
+
+        self.index[new_node.phone] = new_node
+        self.size += 1
+        return "Booking added successfully"
+
+    def _take(self):
+        if self.head is None:
+            return "No bookings to remove"
+        return self._unlink(self.head)
+
+    def remove_by_phone(self, phone):
+        node = self.index.get(phone)
+        if node is None:
+            return "No booking found for this phone number"
+        if self.overflow is not None:
+            return self.overflow.remove(self, lambda: self._unlink(node))
+        return self._unlink(node)
+
+    def remove_last(self):
+        # Least recently used entry when move_to_front marks each use
+        if self.tail is None:
+            return "No bookings to remove"
+        return self._unlink(self.tail)
+
+    def move_to_front(self, phone):
+        node = self.index.get(phone)
+        if node is None:
+            return "No booking found for this phone number"
+        if node is not self.head:
+            self._detach(node)
+            node.next = self.head
+            self.head.prev = node
+            self.head = node
+        return node
+
+    def _unlink(self, node):
+        self._detach(node)
+        del self.index[node.phone]
+        self.size -= 1
+        return node
+
+    def _detach(self, node):
+        if node.prev is None:
+            self.head = node.next
+        else:
+            node.prev.next = node.next
+        if node.next is None:
+            self.tail = node.prev
+        else:
+            node.next.prev = node.prev
+        node.prev = node.next = None
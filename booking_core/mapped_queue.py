@@ -0,0 +1,207 @@
+import mmap
+import os
+import struct
+
+from booking_core.queues import CircularQueue
+
+# File layout: a header, then `size` fixed-width records.
+#   header  magic, size, name width, booking width, front, rear
+#   record  used flag, name, phone, booking (UTF-8, NUL padded)
+MAGIC = b"BOOKRING"
+HEADER = struct.Struct("<8sQQQqq")
+FRONT_OFFSET = 32  # front and rear are the last two header fields
+POSITION = struct.Struct("<q")
+NAME_WIDTH = 64
+PHONE_WIDTH = 10
+BOOKING_WIDTH = 64
+
+TOO_LONG = "Booking is too long to store"
+
+
+# The ring's slots, read and written straight from the mapped file. Supports
+# the indexing and slicing CircularQueue does on its list.
+class MappedRecords:
+    def __init__(self, buffer, size, name_width=NAME_WIDTH, booking_width=BOOKING_WIDTH):
+        self.buffer = buffer
+        self.size = size
+        self.record = struct.Struct(f"<?{name_width}s{PHONE_WIDTH}s{booking_width}s")
+        self.widths = (name_width, PHONE_WIDTH, booking_width)
+
+    def __len__(self):
+        return self.size
+
+    def encode(self, item):
+        if item is None:
+            return bytes(self.record.size)
+        name, phone, booking = (field.encode() for field in item)
+        name_width, phone_width, booking_width = self.widths
+        if len(name) > name_width or len(phone) > phone_width or len(booking) > booking_width:
+            raise ValueError(TOO_LONG)
+        return self.record.pack(True, name, phone, booking)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            start, stop, _ = index.indices(self.size)
+            view = memoryview(self.buffer)[self._offset(start) : self._offset(max(start, stop))]
+            return [
+                (name.rstrip(b"\0").decode(), phone.rstrip(b"\0").decode(), booking.rstrip(b"\0").decode())
+                if used else None
+                for used, name, phone, booking in self.record.iter_unpack(view)
+            ]
+        used, name, phone, booking = self.record.unpack_from(self.buffer, self._offset(index % self.size))
+        if not used:
+            return None
+        return (name.rstrip(b"\0").decode(), phone.rstrip(b"\0").decode(), booking.rstrip(b"\0").decode())
+
+    def __setitem__(self, index, value):
+        if isinstance(index, slice):
+            start, stop, _ = index.indices(self.size)
+            value = list(value)
+            if len(value) != max(0, stop - start):
+                raise ValueError("Slice assignment must keep the ring size")
+            self.write(start, [self.encode(item) for item in value])
+        else:
+            self.write(index % self.size, [self.encode(value)])
+
+    def write(self, start, records):
+        # Encoded records go into consecutive slots with one slice write
+        data = b"".join(records)
+        offset = self._offset(start)
+        self.buffer[offset : offset + len(data)] = data
+
+    def _offset(self, index):
+        return HEADER.size + index * self.record.size
+
+
+# Circular Queue kept in a memory-mapped file: survives restarts, and other
+# local processes can map the same file to read it. One writer at a time.
+class MappedCircularQueue(CircularQueue):
+    def __init__(self, path, size=5, growable=False, overflow=None,
+                 name_width=NAME_WIDTH, booking_width=BOOKING_WIDTH):
+        self.path = path
+        self.growable = growable
+        self.overflow = overflow
+        self.file = open(path, "r+b" if os.path.exists(path) else "w+b")
+        if os.path.getsize(path) >= HEADER.size:
+            # Existing ring: its header decides the size and the widths
+            magic, size, name_width, booking_width, _, _ = HEADER.unpack(self.file.read(HEADER.size))
+            if magic != MAGIC:
+                self.file.close()
+                raise ValueError(f"{path} is not a booking ring file")
+            self._map(size, name_width, booking_width)
+        else:
+            self._map(size, name_width, booking_width)
+            HEADER.pack_into(self.map, 0, MAGIC, size, name_width, booking_width, -1, -1)
+
+    def _map(self, size, name_width, booking_width):
+        record_size = struct.calcsize(f"<?{name_width}s{PHONE_WIDTH}s{booking_width}s")
+        length = HEADER.size + size * record_size
+        if os.path.getsize(self.path) < length:
+            self.file.truncate(length)
+        self.map = mmap.mmap(self.file.fileno(), length)
+        self.size = size
+        self.queue = MappedRecords(self.map, size, name_width, booking_width)
+
+    # front and rear live in the header, so every change is in the file at once
+    @property
+    def front(self):
+        return POSITION.unpack_from(self.map, FRONT_OFFSET)[0]
+
+    @front.setter
+    def front(self, value):
+        POSITION.pack_into(self.map, FRONT_OFFSET, value)
+
+    @property
+    def rear(self):
+        return POSITION.unpack_from(self.map, FRONT_OFFSET + 8)[0]
+
+    @rear.setter
+    def rear(self, value):
+        POSITION.pack_into(self.map, FRONT_OFFSET + 8, value)
+
+    def _store(self, item):
+        try:
+            record = self.queue.encode(item)
+        except ValueError:
+            return TOO_LONG
+        if self.is_full():
+            if not self.growable:
+                return "Queue is full"
+            self._grow(self.size * 2)
+
+        # Write the record before moving rear (then front), so a reader never sees an unwritten slot
+        if self.is_empty():
+            self.queue.write(0, [record])
+            self.rear = 0
+            self.front = 0
+        else:
+            slot = (self.rear + 1) % self.size
+            self.queue.write(slot, [record])
+            self.rear = slot
+
+    def replace(self, index, new_item):
+        try:
+            record = self.queue.encode(new_item)
+        except ValueError:
+            return TOO_LONG
+        self.queue.write((self.front + index) % self.size, [record])
+
+    def _store_many(self, items):
+        # Stores the leading bookings that fit, the way CircularQueue stops at capacity
+        records = []
+        for item in items:
+            try:
+                records.append(self.queue.encode(item))
+            except ValueError:
+                break
+
+        count = len(self)
+        if self.growable and count + len(records) > self.size:
+            new_size = self.size
+            while count + len(records) > new_size:
+                new_size *= 2
+            self._grow(new_size)
+
+        records = records[: self.size - count]
+        n = len(records)
+        if n == 0:
+            return 0
+
+        start = 0 if count == 0 else (self.rear + 1) % self.size
+        first = min(n, self.size - start)
+        self.queue.write(start, records[:first])
+        self.queue.write(0, records[first:])
+
+        self.rear = (start + n - 1) % self.size
+        if count == 0:
+            self.front = start
+        return n
+
+    def _grow(self, new_size):
+        # Unwrap into the new space past the old ring, which the old header
+        # never points at; a crash before the header is rewritten reopens the
+        # old ring as it was. Growth at least doubles, so the bookings fit.
+        old_size = self.size
+        items = self.display()
+        name_width, _, booking_width = self.queue.widths
+        self.map.close()
+        self._map(new_size, name_width, booking_width)
+        self.queue[old_size : old_size + len(items)] = items
+        self.map.flush()
+
+        if items:
+            front, rear = old_size, old_size + len(items) - 1
+        else:
+            front = rear = -1
+        HEADER.pack_into(self.map, 0, MAGIC, new_size, name_width, booking_width, front, rear)
+        self.map.flush()
+        self.queue[0:old_size] = [None] * old_size  # Old slots are free now
+
+    def flush(self):
+        # Force the mapped pages to disk (the OS writes them back anyway)
+        self.map.flush()
+
+    def close(self):
+        self.map.flush()
+        self.map.close()
+        self.file.close()
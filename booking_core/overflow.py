@@ -0,0 +1,129 @@
+import os
+import threading
+
+
+# Base Overflow Policy: decides what happens to a booking that arrives while
+# the structure is full. Structures hand every add/remove to the policy, which
+# calls back into their raw _store(item) / _evict_oldest() methods.
+class OverflowPolicy:
+    def __init__(self):
+        self.room = threading.Condition()
+        self.pending = 0  # Bookings held back to go in ahead of new ones (SpillToDisk)
+
+    def add(self, structure, item):
+        with self.room:
+            if not structure.is_full():
+                return structure._store(item)
+            return self.on_full(structure, item)
+
+    def remove(self, structure, take):
+        with self.room:
+            # Refill first as well, so bookings still waiting (say, on disk
+            # from a previous run) are there to take from an empty structure
+            self.refill(structure)
+            item = take()
+            self.refill(structure)
+            self.room.notify_all()
+            return item
+
+    def on_full(self, structure, item):
+        # Reject: the structure is full, so _store answers with its own
+        # sentinel ("Queue is full", "Stack is full. ...", ...)
+        return structure._store(item)
+
+    def refill(self, structure):
+        pass
+
+
+# Block: wait (with backpressure) until a consumer frees a slot
+class BlockOnFull(OverflowPolicy):
+    def __init__(self, timeout=None):
+        super().__init__()
+        self.timeout = timeout
+
+    def on_full(self, structure, item):
+        if not self.room.wait_for(lambda: not structure.is_full(), self.timeout):
+            return "Timed out waiting for room"
+        return structure._store(item)
+
+
+# Drop Oldest: evict the oldest booking to make room for the new one
+class DropOldest(OverflowPolicy):
+    def __init__(self):
+        super().__init__()
+        self.dropped = 0
+
+    def on_full(self, structure, item):
+        structure._evict_oldest()
+        self.dropped += 1
+        return structure._store(item)
+
+
+# Spill to Disk: append overflow to a JSON-lines file and feed it back in,
+# oldest first, whenever the structure has room again. How far the file has
+# been drained is kept in a small offset file next to it, so a restart only
+# picks up the bookings that were never fed back.
+class SpillToDisk(OverflowPolicy):
+    OFFSET_WIDTH = 20  # Fixed width, so each update overwrites the offset in place
+
+    def __init__(self, path):
+        super().__init__()
+        self.path = path
+        self.offset_path = path + ".offset"
+        self.spill_file = open(path, "ab+")
+        self.offset_file = open(self.offset_path, "r+b" if os.path.exists(self.offset_path) else "w+b")
+
+        # Bookings left over from a previous run are still waiting to drain
+        size = self.spill_file.seek(0, os.SEEK_END)
+        saved = self.offset_file.read().strip()
+        self.read_offset = int(saved) if saved.isdigit() and int(saved) <= size else 0
+        self.spill_file.seek(self.read_offset)
+        self.pending = sum(1 for _ in self.spill_file)
+
+    def add(self, structure, item):
+        with self.room:
+            if self.pending:
+                # Keep arrival order: spilled bookings go back in first
+                self.on_full(structure, item)
+                self.refill(structure)
+                return "Booking spilled to disk"
+            return super().add(structure, item)
+
+    def on_full(self, structure, item):
+        import json  # Only the spill policy needs it
+
+        self.spill_file.write(json.dumps(list(item)).encode() + b"\n")
+        self.spill_file.flush()
+        self.pending += 1
+        return "Booking spilled to disk"
+
+    def refill(self, structure):
+        if not self.pending:
+            return
+        import json
+
+        self.spill_file.seek(self.read_offset)
+        while self.pending and not structure.is_full():
+            line = self.spill_file.readline()
+            self.read_offset += len(line)
+            self.pending -= 1
+            structure._store(tuple(json.loads(line)))
+
+        if not self.pending:
+            # Everything drained: start the file over (truncating first, so a
+            # crash in between leaves an offset past the end, which reads as 0)
+            self.spill_file.truncate(0)
+            self.read_offset = 0
+        self._save_offset()
+
+    def _save_offset(self):
+        self.offset_file.seek(0)
+        self.offset_file.write(str(self.read_offset).zfill(self.OFFSET_WIDTH).encode())
+        self.offset_file.flush()
+
+    def close(self):
+        self.spill_file.close()
+        self.offset_file.close()
+        if not self.pending:
+            os.remove(self.path)
+            os.remove(self.offset_path)
@@ -0,0 +1,126 @@
+from booking_core.sorting import bucket_sort
+
+
+# Cons cell: an immutable (item, rest) pair. Stacks that share a tail share the
+# same cells, so keeping an old version of a stack costs nothing extra.
+class Cons:
+    __slots__ = ("item", "rest", "length")
+
+    def __init__(self, item, rest):
+        self.item = item
+        self.rest = rest
+        self.length = 1 if rest is None else rest.length + 1
+
+
+# Persistent Booking Stack: same interface as BookingStack (booking_core.stacks), but
+# every version is an immutable cons list, so snapshots are O(1) and undo/redo
+# is unlimited. Memory grows with the number of changes, not the snapshots.
+class PersistentBookingStack:
+    def __init__(self, max_size=3):
+        self.top = None
+        self.max_size = max_size
+        self.undo_history = []  # Earlier versions (their top cells)
+        self.redo_history = []
+
+        # Bottom-first list of the version order_top, for O(page) get_range.
+        # Kept in step with single pushes and pops; None until first read and
+        # after any bigger jump (sort, restore, ...), which the next read rebuilds
+        self.order = None
+        self.order_top = None
+
+    def __len__(self):
+        return 0 if self.top is None else self.top.length
+
+    def is_full(self):
+        return len(self) == self.max_size
+
+    def push(self, *booking):
+        if self.is_full():
+            return "Stack is full. Cannot add more bookings."
+        self._change(Cons(booking, self.top))
+        return "Booking added successfully"
+
+    def pop(self):
+        if self.top is None:
+            return "No bookings to remove"
+        item = self.top.item
+        self._change(self.top.rest)
+        return item
+
+    def peek(self):
+        if self.top is None:
+            return "No bookings to show"
+        return self.top.item
+
+    def display(self):
+        # Bottom first, like BookingStack.display()
+        return list(self._order())
+
+    def get_range(self, start, stop):
+        return self._order()[start:stop]
+
+    def _order(self):
+        self._sync_order()
+        if self.order is None:
+            # Cells run from the top down
+            order = []
+            cell = self.top
+            while cell is not None:
+                order.append(cell.item)
+                cell = cell.rest
+            order.reverse()
+            self.order = order
+            self.order_top = self.top
+        return self.order
+
+    def _sync_order(self):
+        if self.order is None or self.top is self.order_top:
+            return
+        if self.top is not None and self.top.rest is self.order_top:
+            self.order.append(self.top.item)  # One push
+        elif self.order_top is not None and self.order_top.rest is self.top:
+            self.order.pop()  # One pop
+        else:
+            self.order = None
+            return
+        self.order_top = self.top
+
+    def bucket_sort(self):
+        # Stable sort by priority (the 4th field); builds one new version
+        top = None
+        for booking in bucket_sort(self.display()):
+            top = Cons(booking, top)
+        self._change(top)
+
+    def snapshot(self):
+        return self.top
+
+    def restore(self, snapshot):
+        self._change(snapshot)
+
+    def restore_bookings(self, bookings):
+        # Restore a version from its bookings, bottom first (how a journal replays restore)
+        top = None
+        for booking in bookings:
+            top = Cons(booking, top)
+        self._change(top)
+
+    def undo(self):
+        if not self.undo_history:
+            return "Nothing to undo"
+        self.redo_history.append(self.top)
+        self.top = self.undo_history.pop()
+        self._sync_order()
+
+    def redo(self):
+        if not self.redo_history:
+            return "Nothing to redo"
+        self.undo_history.append(self.top)
+        self.top = self.redo_history.pop()
+        self._sync_order()
+
+    def _change(self, new_top):
+        self.undo_history.append(self.top)
+        self.redo_history.clear()
+        self.top = new_top
+        self._sync_order()
@@ -0,0 +1,288 @@
+import threading
+
+
+# Circular Queue Class
+class CircularQueue:
+    def __init__(self, size, growable=False, overflow=None):
+        self.size = size
+        self.queue = [None] * size
+        self.front = -1
+        self.rear = -1
+        self.growable = growable  # Double the capacity instead of rejecting when full
+        self.overflow = overflow  # Optional booking_core.overflow policy for a full queue
+
+    def __len__(self):
+        if self.is_empty():
+            return 0
+        return (self.rear - self.front) % self.size + 1
+
+    def is_full(self):
+        return (self.rear + 1) % self.size == self.front
+
+    def is_empty(self):
+        return self.front == -1
+
+    def enqueue(self, item):
+        if self.overflow is not None and not self.growable:
+            return self.overflow.add(self, item)
+        return self._store(item)
+
+    def dequeue(self):
+        if self.overflow is not None:
+            return self.overflow.remove(self, self._take)
+        return self._take()
+
+    def _store(self, item):
+        if self.is_full():
+            if not self.growable:
+                return "Queue is full"
+            self._grow(self.size * 2)
+
+        if self.is_empty():
+            self.front = self.rear = 0
+        else:
+            self.rear = (self.rear + 1) % self.size
+        self.queue[self.rear] = item
+
+    def _evict_oldest(self):
+        return self._take()
+
+    def _take(self):
+        if self.is_empty():
+            return "Queue is empty"
+        elif self.front == self.rear:
+            item = self.queue[self.front]
+            self.front = self.rear = -1
+            return item
+        else:
+            item = self.queue[self.front]
+            self.front = (self.front + 1) % self.size
+            return item
+
+    def peek(self):
+        if self.is_empty():
+            return None
+        return self.queue[self.front]
+
+    def display(self):
+        if self.is_empty():
+            return []
+        elif self.rear >= self.front:
+            return self.queue[self.front : self.rear + 1]
+        else:
+            return self.queue[self.front :] + self.queue[: self.rear + 1]
+
+    def replace(self, index, new_item):
+        # Replace an item at a specific index
+        actual_index = (self.front + index) % self.size
+        self.queue[actual_index] = new_item
+
+    def get_range(self, start, stop):
+        # Items at queue positions [start, stop) without unwrapping the whole ring
+        stop = min(stop, len(self))
+        if start >= stop:
+            return []
+        n = stop - start
+        begin = (self.front + start) % self.size
+        first = min(n, self.size - begin)
+        return self.queue[begin : begin + first] + self.queue[: n - first]
+
+    def enqueue_many(self, items):
+        # Add a whole batch with at most two slice writes; returns how many went
+        # straight into the ring (the rest goes to the overflow policy, if any)
+        if self.overflow is not None and not self.growable:
+            with self.overflow.room:
+                items = list(items)
+                # Bookings the policy is holding back (spilled to disk) go in first
+                self.overflow.refill(self)
+                n = 0 if self.overflow.pending else self._store_many(items)
+                for item in items[n:]:
+                    self.overflow.add(self, item)
+                return n
+        return self._store_many(items)
+
+    def dequeue_many(self, n):
+        if self.overflow is not None:
+            return self.overflow.remove(self, lambda: self._take_many(n))
+        return self._take_many(n)
+
+    def _store_many(self, items):
+        items = list(items)
+        count = len(self)
+        if self.growable and count + len(items) > self.size:
+            new_size = self.size
+            while count + len(items) > new_size:
+                new_size *= 2
+            self._grow(new_size)
+
+        items = items[: self.size - count]
+        n = len(items)
+        if n == 0:
+            return 0
+
+        start = 0 if count == 0 else (self.rear + 1) % self.size
+        first = min(n, self.size - start)
+        self.queue[start : start + first] = items[:first]
+        self.queue[: n - first] = items[first:]
+
+        if count == 0:
+            self.front = start
+        self.rear = (start + n - 1) % self.size
+        return n
+
+    def _take_many(self, n):
+        # Remove up to n items from the front with at most two slice reads
+        count = len(self)
+        n = min(n, count)
+        if n <= 0:
+            return []
+
+        first = min(n, self.size - self.front)
+        items = self.queue[self.front : self.front + first] + self.queue[: n - first]
+        self.queue[self.front : self.front + first] = [None] * first
+        self.queue[: n - first] = [None] * (n - first)
+
+        if n == count:
+            self.front = self.rear = -1
+        else:
+            self.front = (self.front + n) % self.size
+        return items
+
+    def _grow(self, new_size):
+        # Unwrap the ring into a bigger list so the front lands at index 0
+        items = self.display()
+        self.queue = items + [None] * (new_size - len(items))
+        self.size = new_size
+        if items:
+            self.front = 0
+            self.rear = len(items) - 1
+
+
+# Thread-safe Circular Queue: put blocks while full, get blocks while empty.
+# Every public method that reads or moves front/rear holds the lock. It is
+# reentrant, since put/get call enqueue/dequeue and the ring methods call
+# len() while already holding it.
+class BlockingCircularQueue(CircularQueue):
+    def __init__(self, size):
+        super().__init__(size)
+        self.lock = threading.RLock()
+        self.not_empty = threading.Condition(self.lock)
+        self.not_full = threading.Condition(self.lock)
+
+    def __len__(self):
+        with self.lock:
+            return super().__len__()
+
+    def enqueue(self, item):
+        with self.lock:
+            result = super().enqueue(item)
+            self.not_empty.notify()
+            return result
+
+    def dequeue(self):
+        with self.lock:
+            item = super().dequeue()
+            self.not_full.notify()
+            return item
+
+    def enqueue_many(self, items):
+        with self.lock:
+            added = super().enqueue_many(items)
+            self.not_empty.notify_all()
+            return added
+
+    def dequeue_many(self, n):
+        with self.lock:
+            items = super().dequeue_many(n)
+            self.not_full.notify_all()
+            return items
+
+    def peek(self):
+        with self.lock:
+            return super().peek()
+
+    def get_range(self, start, stop):
+        with self.lock:
+            return super().get_range(start, stop)
+
+    def put(self, item, timeout=None):
+        with self.not_full:
+            if not self.not_full.wait_for(lambda: not self.is_full(), timeout):
+                return "Queue is full"
+            self.enqueue(item)
+            self.not_empty.notify()
+
+    def get(self, timeout=None):
+        with self.not_empty:
+            if not self.not_empty.wait_for(lambda: not self.is_empty(), timeout):
+                return "Queue is empty"
+            item = self.dequeue()
+            self.not_full.notify()
+            return item
+
+    def put_many(self, items, timeout=None):
+        # Hand over as much of the batch as fits each time the queue has room
+        items = list(items)
+        added = 0
+        with self.not_full:
+            while added < len(items):
+                if not self.not_full.wait_for(lambda: not self.is_full(), timeout):
+                    break
+                added += self.enqueue_many(items[added:])
+                self.not_empty.notify_all()
+        return added
+
+    def get_many(self, n, timeout=None):
+        # Wait for at least one item, then take up to n without waiting again
+        with self.not_empty:
+            if not self.not_empty.wait_for(lambda: not self.is_empty(), timeout):
+                return []
+            items = self.dequeue_many(n)
+            self.not_full.notify_all()
+            return items
+
+    def display(self):
+        with self.lock:
+            return super().display()
+
+    def replace(self, index, new_item):
+        with self.lock:
+            super().replace(index, new_item)
+
+
+# asyncio Circular Queue: awaitable put/get over the same ring storage
+class AsyncCircularQueue(CircularQueue):
+    def __init__(self, size):
+        import asyncio  # Here, not at the top: asyncio alone takes longer to import than the whole package
+
+        super().__init__(size)
+        self.lock = asyncio.Lock()
+        self.not_empty = asyncio.Condition(self.lock)
+        self.not_full = asyncio.Condition(self.lock)
+
+    async def put(self, item, timeout=None):
+        import asyncio
+
+        async with self.not_full:
+            try:
+                await asyncio.wait_for(
+                    self.not_full.wait_for(lambda: not self.is_full()), timeout
+                )
+            except asyncio.TimeoutError:
+                return "Queue is full"
+            self.enqueue(item)
+            self.not_empty.notify()
+
+    async def get(self, timeout=None):
+        import asyncio
+
+        async with self.not_empty:
+            try:
+                await asyncio.wait_for(
+                    self.not_empty.wait_for(lambda: not self.is_empty()), timeout
+                )
+            except asyncio.TimeoutError:
+                return "Queue is empty"
+            item = self.dequeue()
+            self.not_full.notify()
+            return item
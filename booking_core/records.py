@@ -0,0 +1,89 @@
+import sys
+from array import array
+
+
+# Booking Record: a compact, tuple-like booking. __slots__ drops the per-instance
+# __dict__, and it still unpacks/indexes like the (name, phone, booking[, priority])
+# tuples the structures and Treeviews already use.
+class BookingRecord:
+    __slots__ = ("name", "phone", "booking", "priority")
+
+    def __init__(self, name, phone, booking, priority=None):
+        self.name = name
+        self.phone = phone
+        self.booking = sys.intern(booking)  # Destinations repeat a lot
+        self.priority = priority
+
+    def as_tuple(self):
+        if self.priority is None:
+            return (self.name, self.phone, self.booking)
+        return (self.name, self.phone, self.booking, self.priority)
+
+    def __iter__(self):
+        return iter(self.as_tuple())
+
+    def __len__(self):
+        return 3 if self.priority is None else 4
+
+    def __getitem__(self, index):
+        return self.as_tuple()[index]
+
+    def __eq__(self, other):
+        if not isinstance(other, (tuple, BookingRecord)):
+            return NotImplemented
+        return self.as_tuple() == tuple(other)
+
+    def __lt__(self, other):
+        if not isinstance(other, (tuple, BookingRecord)):
+            return NotImplemented
+        return self.as_tuple() < tuple(other)
+
+    def __hash__(self):
+        return hash(self.as_tuple())
+
+    def __repr__(self):
+        return f"BookingRecord{self.as_tuple()!r}"
+
+
+# Booking Columns: struct-of-arrays store. Phones are packed as integers,
+# priorities as single bytes (0 = no priority) and strings are interned.
+class BookingColumns:
+    def __init__(self):
+        self.names = []
+        self.phones = array("Q")
+        self.bookings = []
+        self.priorities = array("B")
+
+    def __len__(self):
+        return len(self.names)
+
+    def append(self, name, phone, booking, priority=None):
+        self.names.append(sys.intern(name))
+        self.phones.append(int(phone))
+        self.bookings.append(sys.intern(booking))
+        self.priorities.append(priority or 0)
+
+    def pop(self):
+        if not self.names:
+            return "No bookings to remove"
+        booking = self[-1]
+        self.names.pop()
+        self.phones.pop()
+        self.bookings.pop()
+        self.priorities.pop()
+        return booking
+
+    def __getitem__(self, index):
+        # Phones are stored as numbers, so restore the leading zero
+        phone = str(self.phones[index]).zfill(10)
+        priority = self.priorities[index]
+        if priority == 0:
+            return (self.names[index], phone, self.bookings[index])
+        return (self.names[index], phone, self.bookings[index], priority)
+
+    def __iter__(self):
+        for index in range(len(self.names)):
+            yield self[index]
+
+    def get_range(self, start, stop):
+        return [self[index] for index in range(start, min(stop, len(self.names)))]
@@ -0,0 +1,213 @@
+import argparse
+import asyncio
+import json
+import sys
+
+from booking_core.queues import CircularQueue
+from booking_core.sorting import HIGHEST_PRIORITY, LOWEST_PRIORITY
+from booking_core.stacks import PriorityBookingStack
+from booking_core.validation import PHONE_ERROR, is_valid_phone
+
+# Local booking service: the queue (3.py) and the priority stack (7.py) over
+# TCP, one JSON object per line each way:
+#
+#   python -m booking_core.service --port 8765
+#   -> {"id": 1, "op": "enqueue", "booking": ["Ann", "0781234567", "Mount Bisoke"]}
+#   <- {"id": 1, "result": null}
+#
+# Ops: enqueue, dequeue, push, pop, peek ("target": "queue" or "stack") and
+# sort. Results are what the structure returned, messages included, so
+# "Queue is empty" comes back as the result just as the GUI would show it.
+# Clients may pipeline: every complete line in a read is answered in order,
+# and the answers go back in a single write.
+
+HOST = "127.0.0.1"
+PORT = 8765
+BACKLOG = 4096  # Pending connections the listener queues, for bursts of thousands of clients
+READ_SIZE = 64 * 1024
+MAX_LINE = 64 * 1024  # A client sending a longer line is disconnected
+QUEUE_SIZE = 1_000_000
+STACK_SIZE = 1_000_000
+
+
+# Booking Service: one queue and one stack shared by every connection. The
+# handlers never await, so each request runs start to finish without another
+# client's request in between and the structures need no locks.
+class BookingService:
+    def __init__(self, queue_size=QUEUE_SIZE, stack_size=STACK_SIZE):
+        self.queue = CircularQueue(queue_size)
+        self.stack = PriorityBookingStack(max_size=stack_size)
+        self.handlers = {
+            "enqueue": self.enqueue,
+            "dequeue": self.dequeue,
+            "push": self.push,
+            "pop": self.pop,
+            "peek": self.peek,
+            "sort": self.sort,
+        }
+        self.connections = 0
+        self.requests = 0
+
+    def handle_lines(self, lines):
+        """Answer a batch of request lines (bytes) with their response lines, in order."""
+        # One json.loads over the whole batch costs far less than one per line.
+        # If any line is not JSON (or the lines do not split back into one
+        # object each) every line is decoded on its own, so only the bad ones
+        # get an error.
+        try:
+            requests = json.loads(b"[" + b",".join(lines) + b"]")
+        except ValueError:
+            requests = None
+        if (
+            requests is None
+            or len(requests) != len(lines)
+            or not all(isinstance(request, dict) for request in requests)
+        ):
+            requests = [_decode(line) for line in lines]
+        return b"".join([self.respond(request) for request in requests])
+
+    def respond(self, request):
+        self.requests += 1
+        if isinstance(request, str):
+            return _encode({"id": None, "error": request})
+
+        op = request.get("op")
+        handler = self.handlers.get(op) if isinstance(op, str) else None  # A list or object op is unhashable
+        if handler is None:
+            return _encode({"id": request.get("id"), "error": f"Unknown op: {op}"})
+        return _encode({"id": request.get("id"), **handler(request)})
+
+    def enqueue(self, request):
+        booking = _booking(request, with_priority=False)
+        if isinstance(booking, str):
+            return {"error": booking}
+        return {"result": self.queue.enqueue(booking)}
+
+    def dequeue(self, request):
+        return {"result": self.queue.dequeue()}
+
+    def push(self, request):
+        booking = _booking(request, with_priority=True)
+        if isinstance(booking, str):
+            return {"error": booking}
+        return {"result": self.stack.push(*booking)}
+
+    def pop(self, request):
+        return {"result": self.stack.pop()}
+
+    def peek(self, request):
+        target = request.get("target", "queue")
+        if target == "queue":
+            return {"result": self.queue.peek()}
+        if target == "stack":
+            return {"result": self.stack.peek()}
+        return {"error": "Target must be 'queue' or 'stack'"}
+
+    def sort(self, request):
+        self.stack.bucket_sort()
+        return {"result": len(self.stack)}
+
+    async def serve_client(self, reader, writer):
+        self.connections += 1
+        pending = b""
+        try:
+            while True:
+                chunk = await reader.read(READ_SIZE)
+                if not chunk:
+                    break
+                lines = (pending + chunk).split(b"\n")
+                pending = lines.pop()  # The unfinished tail waits for the next read
+                if len(pending) > MAX_LINE:
+                    break
+                lines = [line for line in lines if line.strip()]
+                if lines:
+                    writer.write(self.handle_lines(lines))
+                    await writer.drain()
+        except ConnectionError:
+            pass  # The client went away mid-write; nothing to answer
+        finally:
+            self.connections -= 1
+            writer.close()
+
+
+def _booking(request, with_priority):
+    # The add_booking checks, as a tuple ready for the structure or an error message
+    fields = request.get("booking")
+    if not isinstance(fields, list) or len(fields) != (4 if with_priority else 3):
+        if with_priority:
+            return "booking must be [name, phone, booking, priority]"
+        return "booking must be [name, phone, booking]"
+    name, phone, booking = (str(field).strip() for field in fields[:3])
+    if not (name and phone and booking):
+        return "Please fill out all fields."
+    if not is_valid_phone(phone):
+        return PHONE_ERROR
+    if not with_priority:
+        return (name, phone, booking)
+    priority = fields[3]
+    if type(priority) is not int or not LOWEST_PRIORITY <= priority <= HIGHEST_PRIORITY:
+        return "Priority must be a number between 1 and 5."
+    return (name, phone, booking, priority)
+
+
+def _decode(line):
+    # A request object, or the error message for a line that is not one
+    try:
+        request = json.loads(line)
+    except ValueError:
+        return "Not a valid JSON request"
+    if not isinstance(request, dict):
+        return "Request must be a JSON object"
+    return request
+
+
+_encoder = json.JSONEncoder(separators=(",", ":"))  # Built once; json.dumps would build one per call
+
+
+def _encode(response):
+    return (_encoder.encode(response) + "\n").encode()
+
+
+def raise_open_file_limit():
+    """Lift the soft open-file limit to the hard one; every connection is a file descriptor."""
+    try:
+        import resource
+    except ImportError:
+        return None  # Not on this platform (Windows)
+    soft, hard = resource.getrlimit(resource.RLIMIT_NOFILE)
+    if soft != hard:
+        try:
+            resource.setrlimit(resource.RLIMIT_NOFILE, (hard, hard))
+        except (ValueError, OSError):
+            pass  # Some systems refuse an unlimited soft limit; keep what we have
+    return resource.getrlimit(resource.RLIMIT_NOFILE)[0]
+
+
+async def serve(service, host=HOST, port=PORT):
+    server = await asyncio.start_server(service.serve_client, host, port, backlog=BACKLOG)
+    host, port = server.sockets[0].getsockname()[:2]
+    # The load generator reads this line to find a port picked with --port 0
+    print(f"Serving bookings on {host}:{port}", flush=True)
+    async with server:
+        await server.serve_forever()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Serve the booking queue and stack over TCP as JSON lines.")
+    parser.add_argument("--host", default=HOST)
+    parser.add_argument("--port", type=int, default=PORT, help="0 picks a free port")
+    parser.add_argument("--queue-size", type=int, default=QUEUE_SIZE)
+    parser.add_argument("--stack-size", type=int, default=STACK_SIZE)
+    args = parser.parse_args(argv)
+
+    raise_open_file_limit()
+    service = BookingService(args.queue_size, args.stack_size)
+    try:
+        asyncio.run(serve(service, args.host, args.port))
+    except KeyboardInterrupt:
+        pass
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,112 @@
+import math
+
+# Sorting helpers for prioritised bookings: (name, phone, booking, priority)
+PRIORITY = 3
+LOWEST_PRIORITY = 1
+HIGHEST_PRIORITY = 5
+
+
+def counting_sort(bookings, lo=LOWEST_PRIORITY, hi=HIGHEST_PRIORITY):
+    """Stable counting sort of bookings by their integer priority in [lo, hi]."""
+    counts = [0] * (hi - lo + 2)
+    for booking in bookings:
+        counts[booking[PRIORITY] - lo + 1] += 1
+
+    # counts[p] becomes the first output slot for priority lo + p
+    for p in range(1, len(counts)):
+        counts[p] += counts[p - 1]
+
+    result = [None] * len(bookings)
+    for booking in bookings:
+        slot = booking[PRIORITY] - lo
+        result[counts[slot]] = booking
+        counts[slot] += 1
+    return result
+
+
+NUMPY_MIN_BOOKINGS = 10_000  # Below this, packing into an array costs more than it saves
+FLOAT_EXACT_INT = 2**53  # Largest int a float64 is sure to hold exactly
+
+
+def bucket_sort(bookings):
+    """Stable sort of bookings by any numeric priority (ints, floats, wide ranges).
+
+    Small integer ranges (like the 1-5 priorities) use counting_sort; other
+    big batches use NumPy when it is installed; everything else goes through
+    buckets sized from the data. NaN priorities sort last.
+    """
+    n = len(bookings)
+    if n < 2:
+        return list(bookings)
+
+    priorities = [booking[PRIORITY] for booking in bookings]
+    ints = all(type(p) is int for p in priorities)
+    if not ints and any(p != p for p in priorities):
+        # NaN compares false with everything, so min, max and buckets cannot place it
+        return sorted(bookings, key=_priority_nan_last)
+
+    lo, hi = min(priorities), max(priorities)
+    if lo == hi:
+        return list(bookings)
+
+    if ints and hi - lo <= 2 * n:
+        return counting_sort(bookings, lo, hi)
+
+    if n >= NUMPY_MIN_BOOKINGS:
+        np = _numpy()
+        dtype = None if np is None else _numpy_dtype(np, priorities, ints, lo, hi)
+        if dtype is not None:
+            # Pack the keys, argsort once, then permute the bookings in one pass
+            order = np.argsort(np.array(priorities, dtype=dtype), kind="stable")
+            return [bookings[i] for i in order.tolist()]
+
+    # About four bookings per bucket when priorities are spread evenly
+    bucket_count = max(1, n // 4)
+    try:
+        width = (hi - lo) / bucket_count
+    except OverflowError:
+        width = math.inf  # Integers too far apart for a float
+    if not math.isfinite(width):
+        # An infinite priority, or a range too wide to split into buckets
+        return sorted(bookings, key=_priority)
+
+    buckets = [[] for _ in range(bucket_count)]
+    last = bucket_count - 1
+    for booking, priority in zip(bookings, priorities):
+        buckets[min(int((priority - lo) / width), last)].append(booking)
+
+    result = []
+    for bucket in buckets:
+        if len(bucket) > 1:
+            bucket.sort(key=_priority)
+        result.extend(bucket)
+    return result
+
+
+def _priority(booking):
+    return booking[PRIORITY]
+
+
+def _priority_nan_last(booking):
+    priority = booking[PRIORITY]
+    return (priority != priority, priority)
+
+
+def _numpy_dtype(np, priorities, ints, lo, hi):
+    # An array type that holds every priority exactly, or None to stay in Python
+    if ints:
+        int64 = np.iinfo(np.int64)
+        return np.int64 if int64.min <= lo and hi <= int64.max else None
+    # float64 is exact for floats, and for ints up to 2**53
+    if all(type(p) is float or (type(p) is int and abs(p) <= FLOAT_EXACT_INT) for p in priorities):
+        return np.float64
+    return None
+
+
+def _numpy():
+    # Imported on first use so the optional dependency costs nothing otherwise
+    try:
+        import numpy
+    except ImportError:
+        return None
+    return numpy
@@ -0,0 +1,287 @@
+import queue
+import sqlite3
+import threading
+from contextlib import contextmanager
+
+from booking_core.records import BookingRecord
+
+# Optional on-disk store for bookings, with no server: a single SQLite file.
+# Rows keep their arrival order in the rowid; name, phone and destination
+# are indexed for lookups.
+
+SCHEMA = (
+    "CREATE TABLE IF NOT EXISTS bookings ("
+    "id INTEGER PRIMARY KEY, name TEXT NOT NULL, phone TEXT NOT NULL, booking TEXT NOT NULL, priority INTEGER)",
+    "CREATE INDEX IF NOT EXISTS bookings_name ON bookings (name)",
+    "CREATE INDEX IF NOT EXISTS bookings_phone ON bookings (phone)",
+    "CREATE INDEX IF NOT EXISTS bookings_booking ON bookings (booking)",
+)
+
+# The same SQL text every time, so each connection's statement cache
+# hands back the already-prepared statement
+INSERT = "INSERT INTO bookings (name, phone, booking, priority) VALUES (?, ?, ?, ?)"
+COUNT = "SELECT COUNT(*) FROM bookings"
+OLDEST = "SELECT id, name, phone, booking, priority FROM bookings ORDER BY id LIMIT 1"
+NEWEST = "SELECT id, name, phone, booking, priority FROM bookings ORDER BY id DESC LIMIT 1"
+DELETE = "DELETE FROM bookings WHERE id = ?"
+RANGE = "SELECT name, phone, booking, priority FROM bookings ORDER BY id LIMIT ? OFFSET ?"
+REPLACE = (
+    "UPDATE bookings SET name = ?, phone = ?, booking = ?, priority = ? "
+    "WHERE id = (SELECT id FROM bookings ORDER BY id LIMIT 1 OFFSET ?)"
+)
+BY_NAME = "SELECT name, phone, booking, priority FROM bookings WHERE name = ? ORDER BY id"
+BY_PHONE = "SELECT name, phone, booking, priority FROM bookings WHERE phone = ? ORDER BY id"
+FIRST_BY_PHONE = "SELECT id, name, phone, booking, priority FROM bookings WHERE phone = ? ORDER BY id LIMIT 1"
+PHONE_TAKEN = "SELECT 1 FROM bookings WHERE phone = ? LIMIT 1"
+BY_BOOKING = "SELECT name, phone, booking, priority FROM bookings WHERE booking = ? ORDER BY id"
+
+BATCH_SIZE = 1000  # Inserts buffered before they are written in one transaction
+PHONE_CHUNK = 500  # Phones per IN (...) lookup, under SQLite's parameter limit
+
+# What each interface answers when the store is full, as the in-memory structures do
+STORE_FULL = "Store is full. Cannot add more bookings."
+LIST_FULL = "List is full. Cannot add more bookings."
+QUEUE_FULL = "Queue is full"
+STACK_FULL = "Stack is full. Cannot add more bookings."
+DUPLICATE_PHONE = "A booking with this phone number already exists."
+NOT_A_STACK = "This store is first in, first out; open it with lifo=True to use it as a stack."
+NOT_A_QUEUE = "This store is last in, first out; open it with lifo=False to use it as a queue."
+
+
+# Connection Pool: a few open connections handed out one per caller, so
+# statements stay prepared between calls and threads can read side by side
+class ConnectionPool:
+    def __init__(self, path, size=4):
+        self.idle = queue.Queue()
+        for _ in range(size):
+            connection = sqlite3.connect(path, check_same_thread=False, cached_statements=64)
+            connection.execute("PRAGMA journal_mode = WAL")
+            connection.execute("PRAGMA synchronous = NORMAL")
+            self.idle.put(connection)
+        self.size = size
+
+    @contextmanager
+    def connection(self):
+        connection = self.idle.get()
+        try:
+            yield connection
+        finally:
+            self.idle.put(connection)
+
+    def close(self):
+        for _ in range(self.size):
+            self.idle.get().close()
+
+
+# SQLite Booking Store: the push/pop (stack), enqueue/dequeue (queue) and
+# add_booking/remove_booking (list) interfaces over one table. lifo picks
+# which end removals and peek come from, so a store answers the stack calls
+# only with lifo and the queue calls only without. New bookings are buffered and
+# written in batches; anything that reads flushes them first. Removed
+# bookings come back as BookingRecords, so .name works as on list nodes.
+class SQLiteBookingStore:
+    def __init__(self, path, lifo=False, max_size=None, unique_phones=False, batch_size=BATCH_SIZE, pool_size=4):
+        self.pool = ConnectionPool(path, pool_size)
+        self.lifo = lifo
+        self.unique_phones = unique_phones  # Refuse a second booking for a phone, like IndexedLinkedList
+        self.max_size = max_size
+        self.batch_size = batch_size
+        self.pending = []
+        self.pending_phones = set()  # Phones in pending, kept for unique_phones
+        self.lock = threading.Lock()  # One writer at a time
+        with self.pool.connection() as connection:
+            with connection:
+                for statement in SCHEMA:
+                    connection.execute(statement)
+            self.count = connection.execute(COUNT).fetchone()[0]
+
+    def __len__(self):
+        return self.count
+
+    def is_full(self):
+        return self.count == self.max_size
+
+    def add(self, *booking, full_message=STORE_FULL):
+        with self.lock:
+            if self.is_full():
+                return full_message
+            if self.unique_phones:
+                if self._phone_taken(booking[1]):
+                    return DUPLICATE_PHONE
+                self.pending_phones.add(booking[1])
+            self.pending.append(_row(booking))
+            self.count += 1
+            if len(self.pending) >= self.batch_size:
+                self._flush()
+        return "Booking added successfully"
+
+    def add_many(self, bookings):
+        # Everything in one transaction, whatever the batch size
+        rows = [_row(booking) for booking in bookings]
+        with self.lock:
+            if self.unique_phones:
+                rows = self._new_phones(rows)
+            if self.max_size is not None:
+                del rows[max(0, self.max_size - self.count) :]
+            self.pending.extend(rows)
+            self.count += len(rows)
+            self._flush()
+        return len(rows)
+
+    def flush(self):
+        with self.lock:
+            self._flush()
+
+    def _flush(self):
+        if not self.pending:
+            return
+        with self.pool.connection() as connection:
+            with connection:
+                connection.executemany(INSERT, self.pending)
+        self.pending.clear()
+        self.pending_phones.clear()
+
+    def take(self, empty_message="No bookings to remove"):
+        with self.lock:
+            self._flush()
+            with self.pool.connection() as connection:
+                with connection:
+                    row = connection.execute(NEWEST if self.lifo else OLDEST).fetchone()
+                    if row is None:
+                        return empty_message
+                    connection.execute(DELETE, (row[0],))
+            self.count -= 1
+            return BookingRecord(*_booking(row[1:]))
+
+    def remove_by_phone(self, phone):
+        with self.lock:
+            row = self._first_by_phone(phone)
+            if row is None:
+                return "No booking found for this phone number"
+            with self.pool.connection() as connection:
+                with connection:
+                    connection.execute(DELETE, (row[0],))
+            self.count -= 1
+            return BookingRecord(*_booking(row[1:]))
+
+    def _new_phones(self, rows):
+        # Caller holds the lock. Keeps the first row for each phone not stored yet
+        self._flush()
+        phones = list({row[1] for row in rows})
+        taken = set()
+        with self.pool.connection() as connection:
+            for start in range(0, len(phones), PHONE_CHUNK):
+                chunk = phones[start : start + PHONE_CHUNK]
+                query = f"SELECT phone FROM bookings WHERE phone IN ({', '.join('?' * len(chunk))})"
+                taken.update(phone for (phone,) in connection.execute(query, chunk))
+        new_rows = []
+        for row in rows:
+            if row[1] not in taken:
+                taken.add(row[1])
+                new_rows.append(row)
+        return new_rows
+
+    def _phone_taken(self, phone):
+        # Caller holds the lock. No flush, so adds still go in by the batch
+        if phone in self.pending_phones:
+            return True
+        with self.pool.connection() as connection:
+            return connection.execute(PHONE_TAKEN, (phone,)).fetchone() is not None
+
+    def _first_by_phone(self, phone):
+        # Caller holds the lock
+        self._flush()
+        with self.pool.connection() as connection:
+            return connection.execute(FIRST_BY_PHONE, (phone,)).fetchone()
+
+    def peek(self):
+        with self.lock:
+            self._flush()
+            with self.pool.connection() as connection:
+                row = connection.execute(NEWEST if self.lifo else OLDEST).fetchone()
+        if row is None:
+            return None
+        return _booking(row[1:])
+
+    def display(self):
+        return self.get_range(0, self.count)
+
+    def get_range(self, start, stop):
+        if start >= stop:
+            return []
+        self.flush()
+        with self.pool.connection() as connection:
+            rows = connection.execute(RANGE, (stop - start, start)).fetchall()
+        return [_booking(row) for row in rows]
+
+    def replace(self, index, new_item):
+        with self.lock:
+            self._flush()
+            with self.pool.connection() as connection:
+                with connection:
+                    connection.execute(REPLACE, _row(new_item) + (index,))
+
+    def find_by_name(self, name):
+        return self._find(BY_NAME, name)
+
+    def find_by_phone(self, phone):
+        return self._find(BY_PHONE, phone)
+
+    def find_by_destination(self, booking):
+        return self._find(BY_BOOKING, booking)
+
+    def _find(self, query, value):
+        self.flush()
+        with self.pool.connection() as connection:
+            return [_booking(row) for row in connection.execute(query, (value,))]
+
+    # The interfaces of the in-memory structures
+    def push(self, *booking):
+        if not self.lifo:
+            return NOT_A_STACK
+        return self.add(*booking, full_message=STACK_FULL)
+
+    def pop(self):
+        if not self.lifo:
+            return NOT_A_STACK
+        return self.take()
+
+    def enqueue(self, item):
+        if self.lifo:
+            return NOT_A_QUEUE
+        result = self.add(*item, full_message=QUEUE_FULL)
+        if result == "Booking added successfully":
+            return None  # CircularQueue.enqueue returns nothing on success
+        return result
+
+    def enqueue_many(self, items):
+        if self.lifo:
+            return NOT_A_QUEUE
+        return self.add_many(items)
+
+    def dequeue(self):
+        if self.lifo:
+            return NOT_A_QUEUE
+        return self.take("Queue is empty")
+
+    def add_booking(self, name, phone, booking):
+        return self.add(name, phone, booking, full_message=LIST_FULL)
+
+    def remove_booking(self):
+        return self.take()
+
+    def close(self):
+        self.flush()
+        self.pool.close()
+
+
+def _row(booking):
+    # (name, phone, booking[, priority]) -> the four INSERT parameters
+    name, phone, destination, *priority = booking
+    return (name, phone, destination, priority[0] if priority else None)
+
+
+def _booking(row):
+    if row[3] is None:
+        return tuple(row[:3])
+    return tuple(row)
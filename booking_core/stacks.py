@@ -0,0 +1,162 @@
+from collections import deque
+from itertools import chain
+
+from booking_core.sorting import HIGHEST_PRIORITY, LOWEST_PRIORITY, PRIORITY, bucket_sort
+
+
+# Stack of searched destinations (2.py)
+class Stack:
+    def __init__(self):
+        self.stack = []
+
+    def push(self, item):
+        self.stack.append(item)
+
+    def pop(self):
+        if not self.is_empty():
+            return self.stack.pop()
+        else:
+            return "Stack is empty"
+
+    def is_empty(self):
+        return len(self.stack) == 0
+
+
+# Stack Class for managing bookings (5.py)
+class BookingStack:
+    def __init__(self, max_size=3, overflow=None):
+        self.stack = []
+        self.max_size = max_size
+        self.overflow = overflow  # Optional booking_core.overflow policy for a full stack
+
+    def __len__(self):
+        return len(self.stack)
+
+    def is_full(self):
+        return len(self.stack) == self.max_size
+
+    def push(self, name, phone, booking):
+        if self.overflow is not None:
+            return self.overflow.add(self, (name, phone, booking))
+        return self._store((name, phone, booking))
+
+    def pop(self):
+        if self.overflow is not None:
+            return self.overflow.remove(self, self._take)
+        return self._take()
+
+    def _store(self, item):
+        if self.is_full():
+            return "Stack is full. Cannot add more bookings."
+        self.stack.append(item)
+        return "Booking added successfully"
+
+    def _evict_oldest(self):
+        # The oldest booking sits at the bottom of the stack
+        return self.stack.pop(0)
+
+    def _take(self):
+        if not self.stack:
+            return "No bookings to remove"
+        return self.stack.pop()
+
+    def peek(self):
+        if not self.stack:
+            return "No bookings to show"
+        return self.stack[-1]
+
+    def display(self):
+        return self.stack
+
+    def get_range(self, start, stop):
+        return self.stack[start:stop]
+
+
+# Booking Stack with a priority per booking (7.py), sortable by priority
+class PriorityBookingStack:
+    def __init__(self, max_size=3, overflow=None, keep_priority_order=False):
+        self.stack = []
+        self.max_size = max_size
+        self.overflow = overflow  # Optional booking_core.overflow policy for a full stack
+
+        # Optionally keep one deque per priority, in stack order, as bookings come and go
+        self.by_priority = None
+        if keep_priority_order:
+            self.by_priority = [deque() for _ in range(HIGHEST_PRIORITY - LOWEST_PRIORITY + 1)]
+
+    def __len__(self):
+        return len(self.stack)
+
+    def is_full(self):
+        return len(self.stack) == self.max_size
+
+    def push(self, name, phone, booking, priority):
+        if self.overflow is not None:
+            return self.overflow.add(self, (name, phone, booking, priority))
+        return self._store((name, phone, booking, priority))
+
+    def pop(self):
+        if self.overflow is not None:
+            return self.overflow.remove(self, self._take)
+        return self._take()
+
+    def _store(self, item):
+        if self.is_full():
+            return "Stack is full. Cannot add more bookings."
+        if self.by_priority is not None and not _has_deque(item[PRIORITY]):
+            # One deque per whole priority 1-5; sorting alone accepts any number
+            return "Priority must be a number between 1 and 5."
+        self.stack.append(item)
+        if self.by_priority is not None:
+            self.by_priority[item[PRIORITY] - LOWEST_PRIORITY].append(item)
+        return "Booking added successfully"
+
+    def _evict_oldest(self):
+        # The oldest booking sits at the bottom of the stack
+        booking = self.stack.pop(0)
+        if self.by_priority is not None:
+            self.by_priority[booking[PRIORITY] - LOWEST_PRIORITY].popleft()
+        return booking
+
+    def _take(self):
+        if not self.stack:
+            return "No bookings to remove"
+        booking = self.stack.pop()
+        if self.by_priority is not None:
+            self.by_priority[booking[PRIORITY] - LOWEST_PRIORITY].pop()
+        return booking
+
+    def peek(self):
+        if not self.stack:
+            return "No bookings to show"
+        return self.stack[-1]
+
+    def display(self):
+        return self.stack
+
+    def get_range(self, start, stop):
+        return self.stack[start:stop]
+
+    def bucket_sort(self):
+        if self.by_priority is not None:
+            # The per-priority deques already hold the sorted order
+            self.stack = list(self.priority_order())
+        else:
+            # Stable; picks counting sort, NumPy or data-sized buckets to suit the priorities
+            self.stack = bucket_sort(self.stack)
+
+    def priority_order(self):
+        """Lazily yield bookings by priority (1 first), stable within a priority."""
+        if self.by_priority is None:
+            return iter(bucket_sort(self.stack))
+        return chain.from_iterable(self.by_priority)
+
+    def next_by_priority(self):
+        # Most urgent booking; O(1) when keep_priority_order is on
+        for booking in self.priority_order():
+            return booking
+        return "No bookings to show"
+
+
+def _has_deque(priority):
+    return type(priority) is int and LOWEST_PRIORITY <= priority <= HIGHEST_PRIORITY
@@ -0,0 +1,143 @@
+from collections import Counter, defaultdict
+
+
+# Treeview Sync: keeps a ttk.Treeview in step with a booking structure by
+# applying only the rows that changed instead of deleting and re-inserting all
+class TreeviewSync:
+    def __init__(self, tree):
+        self.tree = tree
+        self.rows = []  # Values currently shown, in display order
+        self.items = []  # Treeview item id for each row
+
+    # Direct deltas, for callers that already know what changed
+
+    def append(self, values):
+        values = tuple(values)
+        self.items.append(self.tree.insert("", "end", values=values))
+        self.rows.append(values)
+
+    def pop(self, index=-1):
+        self.tree.delete(self.items.pop(index))
+        return self.rows.pop(index)
+
+    def replace(self, index, values):
+        values = tuple(values)
+        self.tree.item(self.items[index], values=values)
+        self.rows[index] = values
+
+    def sync(self, bookings):
+        """Bring the table in line with bookings, touching only changed rows."""
+        new_rows = [tuple(booking) for booking in bookings]
+        old_rows = self.rows
+
+        # Skip the unchanged head and tail, leaving the changed middle
+        start = 0
+        limit = min(len(old_rows), len(new_rows))
+        while start < limit and old_rows[start] == new_rows[start]:
+            start += 1
+        old_end, new_end = len(old_rows), len(new_rows)
+        while old_end > start and new_end > start and old_rows[old_end - 1] == new_rows[new_end - 1]:
+            old_end -= 1
+            new_end -= 1
+
+        old_middle = old_rows[start:old_end]
+        new_middle = new_rows[start:new_end]
+        if not old_middle and not new_middle:
+            return
+
+        if len(old_middle) == len(new_middle):
+            if Counter(old_middle) == Counter(new_middle):
+                self._permute(start, old_middle, new_middle)
+            else:
+                for offset, values in enumerate(new_middle):
+                    if old_middle[offset] != values:
+                        self.replace(start + offset, values)
+            return
+
+        # Different lengths: drop the old middle rows and insert the new ones
+        if old_middle:
+            self.tree.delete(*self.items[start:old_end])
+        new_items = [
+            self.tree.insert("", start + offset, values=values)
+            for offset, values in enumerate(new_middle)
+        ]
+        self.items[start:old_end] = new_items
+        self.rows[start:old_end] = new_middle
+
+    def _permute(self, start, old_middle, new_middle):
+        # Same rows in a new order (e.g. after a sort): move items, don't rebuild
+        free_items = defaultdict(list)
+        for offset, values in enumerate(old_middle):
+            free_items[values].append(self.items[start + offset])
+        for values in free_items:
+            free_items[values].reverse()
+
+        for offset, values in enumerate(new_middle):
+            item = free_items[values].pop()
+            self.tree.move(item, "", start + offset)
+            self.items[start + offset] = item
+            self.rows[start + offset] = values
+
+    def index(self, item):
+        return self.tree.index(item)
+
+
+# Virtual Table: shows only the visible page of a large booking structure.
+# Rows are fetched lazily through count() and fetch(start, stop) as the user
+# scrolls, so the widget holds a screenful of items whatever the data size.
+class VirtualTable:
+    def __init__(self, tree, scrollbar, count, fetch, overscan=5, row_height=25):
+        self.tree = tree
+        self.scrollbar = scrollbar
+        self.count = count
+        self.fetch = fetch
+        self.overscan = overscan  # Extra rows kept below the visible page
+        self.row_height = row_height
+        self.first = 0  # Index of the booking shown in the top row
+        self.page_size = int(tree.cget("height"))
+        self.rows = TreeviewSync(tree)
+
+        # Take over scrolling from the Treeview itself
+        scrollbar.configure(command=self.yview)
+        tree.configure(yscrollcommand="")
+        tree.bind("<Configure>", self.on_resize)
+        tree.bind("<MouseWheel>", self.on_mouse_wheel)
+        tree.bind("<Button-4>", lambda event: self.scroll(-3))
+        tree.bind("<Button-5>", lambda event: self.scroll(3))
+
+    def refresh(self):
+        total = self.count()
+        self.first = max(0, min(self.first, total - self.page_size))
+        stop = min(total, self.first + self.page_size + self.overscan)
+        self.rows.sync(self.fetch(self.first, stop))
+        self.tree.yview_moveto(0)
+
+        if total:
+            self.scrollbar.set(self.first / total, min(1.0, (self.first + self.page_size) / total))
+        else:
+            self.scrollbar.set(0.0, 1.0)
+
+    def yview(self, *args):
+        # Scrollbar callback: ("moveto", fraction) or ("scroll", n, "units"/"pages")
+        if args[0] == "moveto":
+            self.first = int(float(args[1]) * self.count())
+        elif args[0] == "scroll":
+            step = self.page_size if args[2] == "pages" else 1
+            self.first += int(args[1]) * step
+        self.refresh()
+
+    def scroll(self, rows):
+        self.first += rows
+        self.refresh()
+        return "break"
+
+    def on_mouse_wheel(self, event):
+        return self.scroll(-3 if event.delta > 0 else 3)
+
+    def on_resize(self, event):
+        self.page_size = max(1, event.height // self.row_height)
+        self.refresh()
+
+    def index(self, item):
+        # Position of a shown row within the whole structure
+        return self.first + self.tree.index(item)
@@ -0,0 +1,227 @@
+class Node:
+    __slots__ = ("key", "left", "right")
+
+    def __init__(self, key):
+        self.key = key
+        self.left = None
+        self.right = None
+
+
+class BinaryTree:
+    def __init__(self):
+        self.root = None
+
+    def insert(self, key):
+        if self.root is None:
+            self.root = Node(key)
+        else:
+            self._insert_recursive(self.root, key)
+
+    def _insert_recursive(self, current, key):
+        if key < current.key:
+            if current.left is None:
+                current.left = Node(key)
+            else:
+                self._insert_recursive(current.left, key)
+        else:
+            if current.right is None:
+                current.right = Node(key)
+            else:
+                self._insert_recursive(current.right, key)
+
+    # Keys are (name, phone, booking) tuples, so the tree is ordered by name first
+
+    def __iter__(self):
+        return self.in_order()
+
+    def in_order(self, lo=None):
+        """Lazily yield keys in order, starting at the first name >= lo."""
+        stack = []
+        current = self.root
+        while current is not None:
+            if lo is None or current.key[0] >= lo:
+                stack.append(current)
+                current = current.left
+            else:
+                current = current.right
+
+        while stack:
+            node = stack.pop()
+            yield node.key
+            current = node.right
+            while current is not None:
+                stack.append(current)
+                current = current.left
+
+    def find(self, name):
+        current = self.root
+        while current is not None:
+            if name == current.key[0]:
+                return current.key
+            current = current.left if name < current.key[0] else current.right
+        return None
+
+    def range(self, lo, hi):
+        """Yield bookings whose name is in [lo, hi), alphabetically."""
+        for key in self.in_order(lo):
+            if key[0] >= hi:
+                return
+            yield key
+
+    def prefix(self, text):
+        for key in self.in_order(text):
+            if not key[0].startswith(text):
+                return
+            yield key
+
+
+# AVL Node: remembers the height of its subtree
+class AVLNode(Node):
+    __slots__ = ("height",)
+
+    def __init__(self, key):
+        super().__init__(key)
+        self.height = 1
+
+
+# Self-balancing (AVL) Binary Tree with iterative insert and delete
+class BalancedBinaryTree(BinaryTree):
+    def __init__(self):
+        super().__init__()
+        self.size = 0
+        self.rotations = 0  # Total single rotations done while rebalancing
+
+    def height(self):
+        return self._height(self.root)
+
+    def load_sorted(self, keys):
+        """Replace the contents with keys that are already in order, in O(n)."""
+        keys = list(keys)
+        self.root = self._build(keys, 0, len(keys))
+        self.size = len(keys)
+
+    def _build(self, keys, lo, hi):
+        # The middle key becomes the root, so the heights differ by at most one
+        if lo >= hi:
+            return None
+        mid = (lo + hi) // 2
+        node = AVLNode(keys[mid])
+        node.left = self._build(keys, lo, mid)
+        node.right = self._build(keys, mid + 1, hi)
+        self._update_height(node)
+        return node
+
+    def insert(self, key):
+        new_node = AVLNode(key)
+        self.size += 1
+        if self.root is None:
+            self.root = new_node
+            return
+
+        # Walk down to the insertion point, remembering the path
+        path = []
+        current = self.root
+        while current is not None:
+            path.append(current)
+            current = current.left if key < current.key else current.right
+
+        parent = path[-1]
+        if key < parent.key:
+            parent.left = new_node
+        else:
+            parent.right = new_node
+
+        self._rebalance_path(path)
+
+    def delete(self, key):
+        # Find the node holding the key, remembering the path
+        path = []
+        current = self.root
+        while current is not None and current.key != key:
+            path.append(current)
+            current = current.left if key < current.key else current.right
+
+        if current is None:
+            return "Key not found"
+
+        removed_key = current.key
+        if current.left is not None and current.right is not None:
+            # Two children: copy the in-order successor up, then unlink it
+            path.append(current)
+            successor = current.right
+            while successor.left is not None:
+                path.append(successor)
+                successor = successor.left
+            current.key = successor.key
+            current = successor
+
+        child = current.left if current.left is not None else current.right
+        if not path:
+            self.root = child
+        elif path[-1].left is current:
+            path[-1].left = child
+        else:
+            path[-1].right = child
+
+        self.size -= 1
+        self._rebalance_path(path)
+        return removed_key
+
+    def _rebalance_path(self, path):
+        # Fix heights and balance bottom-up along the path to the root,
+        # stopping early once a subtree comes out with its old height
+        for i in range(len(path) - 1, -1, -1):
+            node = path[i]
+            old_height = node.height
+            new_root = self._rebalance(node)
+            if new_root is node:
+                if node.height == old_height:
+                    break
+                continue
+            if i == 0:
+                self.root = new_root
+            elif path[i - 1].left is node:
+                path[i - 1].left = new_root
+            else:
+                path[i - 1].right = new_root
+
+    def _rebalance(self, node):
+        self._update_height(node)
+        balance = self._height(node.left) - self._height(node.right)
+
+        if balance > 1:
+            if self._height(node.left.left) < self._height(node.left.right):
+                node.left = self._rotate_left(node.left)
+            return self._rotate_right(node)
+
+        if balance < -1:
+            if self._height(node.right.right) < self._height(node.right.left):
+                node.right = self._rotate_right(node.right)
+            return self._rotate_left(node)
+
+        return node
+
+    def _rotate_left(self, node):
+        pivot = node.right
+        node.right = pivot.left
+        pivot.left = node
+        self._update_height(node)
+        self._update_height(pivot)
+        self.rotations += 1
+        return pivot
+
+    def _rotate_right(self, node):
+        pivot = node.left
+        node.left = pivot.right
+        pivot.right = node
+        self._update_height(node)
+        self._update_height(pivot)
+        self.rotations += 1
+        return pivot
+
+    def _update_height(self, node):
+        node.height = 1 + max(self._height(node.left), self._height(node.right))
+
+    @staticmethod
+    def _height(node):
+        return node.height if node is not None else 0
@@ -0,0 +1,163 @@
+import heapq
+
+
+# Radix (compressed) trie node. Each node caches the top-k words below it,
+# so completing a prefix never has to look at the rest of the catalog.
+class _TrieNode:
+    __slots__ = ("edge", "children", "word", "score", "top")
+
+    def __init__(self, edge=""):
+        self.edge = edge  # Label on the edge leading into this node
+        self.children = {}  # First character of the child's edge -> child
+        self.word = None  # Display form of the word ending here, if any
+        self.score = 0
+        self.top = []  # Up to top_k (-score, word) pairs, best first
+
+
+# Prefix autocomplete over destination names, ranked by popularity.
+# Matching is case-insensitive; completions come back in their display form.
+class Trie:
+    def __init__(self, top_k=10):
+        self.top_k = top_k
+        self.root = _TrieNode()
+        self.size = 0
+        self.alphabet = set()  # Characters seen, for the typo-tolerant search
+
+    def __len__(self):
+        return self.size
+
+    def __contains__(self, word):
+        return self.get(word) is not None
+
+    def get(self, word):
+        """Display form of a word in the trie (any casing), or None."""
+        node, rest = self._walk(word.lower())
+        if node is None or rest:
+            return None
+        return node.word
+
+    def add(self, word, score=0):
+        key = word.lower()
+        self.alphabet.update(key)
+        path = [self.root]
+        node = self.root
+        rest = key
+        while rest:
+            child = node.children.get(rest[0])
+            if child is None:
+                child = _TrieNode(rest)
+                node.children[rest[0]] = child
+                rest = ""
+            else:
+                common = _common_prefix_length(child.edge, rest)
+                if common < len(child.edge):
+                    # Split the edge: node -> middle -> child
+                    middle = _TrieNode(child.edge[:common])
+                    child.edge = child.edge[common:]
+                    middle.children[child.edge[0]] = child
+                    middle.top = list(child.top)
+                    node.children[rest[0]] = middle
+                    child = middle
+                rest = rest[common:]
+            node = child
+            path.append(node)
+
+        if node.word is None:
+            self.size += 1
+        node.word = word
+        node.score = score
+
+        # Only the nodes on this word's path can change their top-k lists
+        for node in reversed(path):
+            self._refresh_top(node)
+
+    def bump(self, word, amount=1):
+        # Raise a word's popularity, e.g. each time it is searched for
+        node, rest = self._walk(word.lower())
+        if node is None or rest or node.word is None:
+            return "Word not found"
+        self.add(node.word, node.score + amount)
+
+    def complete(self, prefix, k=None):
+        """Top-k completions of prefix; cost depends on the prefix, not the catalog."""
+        k = k or self.top_k
+        node = self._prefix_node(prefix.lower())
+        if node is None:
+            return []
+        return [word for _, word in node.top[:k]]
+
+    def complete_fuzzy(self, prefix, k=None):
+        """Like complete, but also matches prefixes one edit (typo) away."""
+        k = k or self.top_k
+        key = prefix.lower()
+        exact = self.complete(key, k)
+        if len(exact) >= k:
+            return exact
+
+        candidates = []
+        for variant in self._one_edit_variants(key):
+            node = self._prefix_node(variant)
+            if node is not None:
+                candidates.extend(node.top[:k])
+
+        results = list(exact)
+        for _, word in sorted(set(candidates)):
+            if len(results) == k:
+                break
+            if word not in results:
+                results.append(word)
+        return results
+
+    def _one_edit_variants(self, key):
+        for i in range(len(key)):
+            yield key[:i] + key[i + 1 :]  # Deletion
+            for char in self.alphabet:
+                if char != key[i]:
+                    yield key[:i] + char + key[i + 1 :]  # Substitution
+        for i in range(len(key) + 1):
+            for char in self.alphabet:
+                yield key[:i] + char + key[i:]  # Insertion
+        for i in range(len(key) - 1):
+            if key[i] != key[i + 1]:
+                yield key[:i] + key[i + 1] + key[i] + key[i + 2 :]  # Transposition
+
+    def _prefix_node(self, key):
+        # The node whose subtree holds every word starting with key
+        node, rest = self._walk(key)
+        if node is None:
+            return None
+        if rest:
+            child = node.children.get(rest[0])
+            if child is None or not child.edge.startswith(rest):
+                return None
+            node = child
+        return node
+
+    def _walk(self, key):
+        # Follow whole edges; returns the last node reached and what is left of key
+        node = self.root
+        rest = key
+        while rest:
+            child = node.children.get(rest[0])
+            if child is None:
+                return None, rest
+            if not rest.startswith(child.edge):
+                return node, rest
+            node = child
+            rest = rest[len(child.edge) :]
+        return node, rest
+
+    def _refresh_top(self, node):
+        candidates = [entry for child in node.children.values() for entry in child.top]
+        if node.word is not None:
+            candidates.append((-node.score, node.word))
+        node.top = heapq.nsmallest(self.top_k, candidates)
+
+
+def _common_prefix_length(a, b):
+    length = 0
+    for x, y in zip(a, b):
+        if x != y:
+            break
+        length += 1
+    return length
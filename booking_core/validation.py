@@ -0,0 +1,63 @@
+from booking_core.sorting import _numpy
+
+# Phone rule shared by every add_booking and the bulk importer: ten ASCII
+# digits starting with 078 or 079.
+PHONE_ERROR = "Phone number must start with '078' or '079' and contain 10 digits."
+
+# Zero-width match at the start of every line that is not a valid phone.
+# Left as text: re compiles it on first use (and caches it), so importing
+# this module does not pay for importing re.
+INVALID_PHONE_LINE = r"^(?!07[89][0-9]{7}$)"
+
+NUMPY_MIN_PHONES = 100_000  # Below this, the regex scan is as fast as NumPy
+
+
+def is_valid_phone(phone):
+    return len(phone) == 10 and phone.isascii() and phone.isdigit() and phone[:3] in ("078", "079")
+
+
+def invalid_phones(phones):
+    """Indices of the invalid phone numbers in a column, checked as one batch.
+
+    Joins the column into one buffer and scans it with a compiled regex, or
+    checks it as a NumPy character array for very large columns.
+    """
+    if not isinstance(phones, list):
+        phones = list(phones)
+    if not phones:
+        return []
+
+    if len(phones) >= NUMPY_MIN_PHONES:
+        np = _numpy()
+        if np is not None:
+            return _invalid_by_numpy(np, phones)
+
+    import re
+
+    text = "\n".join(phones)
+    if text.count("\n") != len(phones) - 1:
+        # A value holds a newline itself, so lines no longer line up with rows
+        return [index for index, phone in enumerate(phones) if not is_valid_phone(phone)]
+
+    invalid = []
+    row = 0
+    position = 0
+    for match in re.finditer(INVALID_PHONE_LINE, text, re.MULTILINE):
+        row += text.count("\n", position, match.start())
+        position = match.start()
+        invalid.append(row)
+    return invalid
+
+
+def _invalid_by_numpy(np, phones):
+    # 11 characters wide, so anything longer than 10 still shows up in the last column
+    chars = np.array(phones, dtype="U11").view(np.uint32).reshape(len(phones), 11)
+    digits = chars[:, :10]
+    valid = (
+        (chars[:, 10] == 0)
+        & ((digits >= ord("0")) & (digits <= ord("9"))).all(axis=1)
+        & (chars[:, 0] == ord("0"))
+        & (chars[:, 1] == ord("7"))
+        & ((chars[:, 2] == ord("8")) | (chars[:, 2] == ord("9")))
+    )
+    return np.flatnonzero(~valid).tolist()
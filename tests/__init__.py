@@ -0,0 +1,2 @@
+# Regression tests for booking_core; run them from the repository root with
+# "python -m pytest"
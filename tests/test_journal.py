@@ -0,0 +1,110 @@
+import os
+import pickle
+
+from booking_core.journal import open_durable
+from booking_core.linked_list import LinkedList
+from booking_core.persistent_stack import PersistentBookingStack
+from booking_core.queues import CircularQueue
+from booking_core.stacks import PriorityBookingStack, Stack
+
+
+def bookings(count, first=0):
+    return [(f"Customer {i}", f"078{i:07d}", "Mount Bisoke") for i in range(first, first + count)]
+
+
+def test_torn_log_tail_is_dropped_and_logging_resumes(tmp_path):
+    queue = open_durable(CircularQueue(4, growable=True), tmp_path, fsync_interval=0)
+    for booking in bookings(3):
+        queue.enqueue(booking)
+    queue.journal.close()  # A crash: no final snapshot
+
+    # The last write was cut off half way through a line
+    log_path = os.path.join(tmp_path, "bookings.log")
+    committed = os.path.getsize(log_path)
+    with open(log_path, "ab") as log:
+        log.write(b'[4,"enqueue",[["Customer 3","07800')
+
+    queue = open_durable(CircularQueue(4, growable=True), tmp_path, fsync_interval=0)
+    assert queue.display() == bookings(3)
+    assert os.path.getsize(log_path) == committed
+
+    queue.enqueue(bookings(1, 3)[0])
+    queue.journal.close()
+    queue = open_durable(CircularQueue(4, growable=True), tmp_path, fsync_interval=0)
+    assert queue.display() == bookings(4)
+    queue.journal.close()
+
+
+def test_snapshot_then_log_replay(tmp_path):
+    stack = open_durable(PriorityBookingStack(max_size=None), tmp_path, fsync_interval=0)
+    for name, phone, booking in bookings(5):
+        stack.push(name, phone, booking, 5)
+    stack.checkpoint()
+    stack.pop()
+    stack.push("Late", "0791234567", "Mount Karisimbi", 1)
+    stack.bucket_sort()
+    expected = list(stack.display())
+    stack.journal.close()
+
+    stack = open_durable(PriorityBookingStack(max_size=None), tmp_path, fsync_interval=0)
+    assert stack.display() == expected
+    assert stack.display()[0] == ("Late", "0791234567", "Mount Karisimbi", 1)
+    stack.journal.close()
+
+
+def test_snapshot_is_columnar_for_booking_tuples(tmp_path):
+    bookings_list = open_durable(LinkedList(max_size=None), tmp_path, fsync_interval=0)
+    for booking in bookings(10):
+        bookings_list.add_booking(*booking)
+    bookings_list.close()
+
+    with open(os.path.join(tmp_path, "bookings.snapshot"), "rb") as snapshot:
+        assert "columns" in pickle.load(snapshot)
+    bookings_list = open_durable(LinkedList(max_size=None), tmp_path, fsync_interval=0)
+    assert bookings_list.display() == bookings(10)
+    bookings_list.journal.close()
+
+
+def test_log_entries_covered_by_the_snapshot_are_not_replayed(tmp_path):
+    queue = open_durable(CircularQueue(4, growable=True), tmp_path, fsync_interval=0)
+    for booking in bookings(3):
+        queue.enqueue(booking)
+    log_path = os.path.join(tmp_path, "bookings.log")
+    with open(log_path, "rb") as log:
+        old_log = log.read()
+    queue.close()
+
+    # A crash after the snapshot was swapped in but before the log was truncated
+    with open(log_path, "wb") as log:
+        log.write(old_log)
+
+    queue = open_durable(CircularQueue(4, growable=True), tmp_path, fsync_interval=0)
+    assert queue.display() == bookings(3)
+    queue.journal.close()
+
+
+def test_snapshot_falls_back_to_pickling_other_items(tmp_path):
+    history = open_durable(Stack(), tmp_path, fsync_interval=0)
+    history.push("Added Customer 0")
+    history.push(("Customer 1", "0780000001"))
+    history.close()
+
+    history = open_durable(Stack(), tmp_path, fsync_interval=0)
+    assert history.stack == ["Added Customer 0", ("Customer 1", "0780000001")]
+    history.journal.close()
+
+
+def test_restore_is_replayed_after_a_restart(tmp_path):
+    stack = open_durable(PersistentBookingStack(max_size=None), tmp_path, fsync_interval=0)
+    for booking in bookings(3):
+        stack.push(*booking)
+    version = stack.snapshot()  # The stack's own O(1) snapshot, not a checkpoint
+    stack.push(*bookings(1, first=3)[0])
+    stack.restore(version)
+    stack.journal.close()  # A crash: no checkpoint on the way out
+
+    stack = open_durable(PersistentBookingStack(max_size=None), tmp_path, fsync_interval=0)
+    assert stack.display() == bookings(3)
+    stack.undo()
+    assert stack.display() == bookings(4)
+    stack.journal.close()
@@ -0,0 +1,52 @@
+import pytest
+
+from booking_core import mapped_queue
+from booking_core.mapped_queue import MappedCircularQueue
+
+
+def booking(index):
+    return (f"Customer {index}", f"078{index:07d}", "Mount Bisoke")
+
+
+def wrapped_ring(path):
+    # Full ring of four whose front is not at record 0
+    queue = MappedCircularQueue(str(path), size=4, growable=True)
+    for index in range(4):
+        queue.enqueue(booking(index))
+    queue.dequeue()
+    queue.dequeue()
+    queue.enqueue(booking(4))
+    queue.enqueue(booking(5))
+    return queue
+
+
+def test_growing_a_wrapped_ring_keeps_its_order_across_a_restart(tmp_path):
+    queue = wrapped_ring(tmp_path / "ring")
+    queue.enqueue(booking(6))
+    assert queue.size == 8
+    queue.close()
+
+    queue = MappedCircularQueue(str(tmp_path / "ring"))
+    assert queue.display() == [booking(index) for index in range(2, 7)]
+    queue.close()
+
+
+def crash(*args):
+    raise RuntimeError("crash")
+
+
+def test_a_crash_while_growing_reopens_the_old_ring(tmp_path, monkeypatch):
+    queue = wrapped_ring(tmp_path / "ring")
+    # The first record written after the file is enlarged never lands
+    monkeypatch.setattr(mapped_queue.MappedRecords, "write", crash)
+    with pytest.raises(RuntimeError):
+        queue.enqueue(booking(6))
+    monkeypatch.undo()
+    queue.close()
+
+    queue = MappedCircularQueue(str(tmp_path / "ring"), growable=True)
+    assert queue.size == 4
+    assert queue.display() == [booking(index) for index in range(2, 6)]
+    queue.enqueue(booking(6))
+    assert queue.display() == [booking(index) for index in range(2, 7)]
+    queue.close()
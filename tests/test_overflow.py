@@ -0,0 +1,49 @@
+from booking_core.overflow import SpillToDisk
+from booking_core.queues import CircularQueue
+
+
+def names(items):
+    return [item[0] for item in items]
+
+
+def booking(name):
+    return (name, "0781234567", "Mount Bisoke")
+
+
+def spill_two_then_restart(path):
+    policy = SpillToDisk(str(path))
+    queue = CircularQueue(2, overflow=policy)
+    for name in ("old0", "old1", "old2", "old3"):
+        queue.enqueue(booking(name))
+    # A crash: the ring (old0, old1) is lost, the spill file is not
+    policy.spill_file.close()
+    policy.offset_file.close()
+    policy = SpillToDisk(str(path))
+    return CircularQueue(2, overflow=policy), policy
+
+
+def test_restart_delivers_spilled_bookings_once_in_order(tmp_path):
+    queue, policy = spill_two_then_restart(tmp_path / "spill.jsonl")
+    assert policy.pending == 2
+    assert names([queue.dequeue(), queue.dequeue()]) == ["old2", "old3"]
+    assert queue.dequeue() == "Queue is empty"
+    policy.close()
+
+
+def test_drained_bookings_are_not_delivered_again_after_a_restart(tmp_path):
+    path = tmp_path / "spill.jsonl"
+    queue, policy = spill_two_then_restart(path)
+    assert names([queue.dequeue()]) == ["old2"]  # Takes old2, refills old3 from disk
+    policy.spill_file.close()
+    policy.offset_file.close()
+
+    policy = SpillToDisk(str(path))
+    assert policy.pending == 0
+    policy.close()
+
+
+def test_enqueue_many_waits_behind_spilled_bookings(tmp_path):
+    queue, policy = spill_two_then_restart(tmp_path / "spill.jsonl")
+    queue.enqueue_many([booking("new0"), booking("new1")])
+    assert names(queue.dequeue() for _ in range(4)) == ["old2", "old3", "new0", "new1"]
+    policy.close()
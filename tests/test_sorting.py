@@ -0,0 +1,25 @@
+import math
+
+from booking_core.sorting import NUMPY_MIN_BOOKINGS, bucket_sort
+
+
+def with_priorities(priorities):
+    return [(f"Guest {index}", "0781234567", "Mount Bisoke", priority) for index, priority in enumerate(priorities)]
+
+
+def priorities(bookings):
+    return [booking[3] for booking in bookings]
+
+
+def test_nan_priorities_sort_last_and_keep_their_order():
+    nan = math.nan
+    result = bucket_sort(with_priorities([3.5, nan, 1.0, 2.2, math.inf, 0.5, nan]))
+    assert priorities(result)[:5] == [0.5, 1.0, 2.2, 3.5, math.inf]
+    assert [booking[0] for booking in result[5:]] == ["Guest 1", "Guest 6"]
+
+
+def test_close_wide_range_ints_keep_their_exact_order():
+    # Above 2**53 neighbouring ints share a float64; the sort must not lose them
+    count = NUMPY_MIN_BOOKINGS + 1
+    keys = [2**60 + (index * 7919) % count for index in range(count)] + [0]
+    assert priorities(bucket_sort(with_priorities(keys))) == sorted(keys)
@@ -0,0 +1,33 @@
+from booking_core.sqlite_store import DUPLICATE_PHONE, NOT_A_QUEUE, NOT_A_STACK, SQLiteBookingStore
+
+
+def test_unique_phone_adds_are_still_batched(tmp_path):
+    store = SQLiteBookingStore(str(tmp_path / "bookings.db"), unique_phones=True, batch_size=3)
+    store.add_booking("Ann", "0781234567", "Mount Bisoke")
+    store.add_booking("Ben", "0781234568", "Mount Bisoke")
+    assert len(store.pending) == 2  # Not flushed one by one
+    assert store.add_booking("Cat", "0781234567", "Mount Bisoke") == DUPLICATE_PHONE
+
+    store.add_booking("Dan", "0781234569", "Mount Bisoke")
+    assert store.pending == []  # The third add filled the batch
+    assert store.add_booking("Eve", "0781234568", "Mount Bisoke") == DUPLICATE_PHONE
+    assert [booking[0] for booking in store.display()] == ["Ann", "Ben", "Dan"]
+    store.close()
+
+
+def test_stack_and_queue_calls_follow_the_store_order(tmp_path):
+    stack = SQLiteBookingStore(str(tmp_path / "stack.db"), lifo=True)
+    stack.push("Ann", "0781234567", "Mount Bisoke")
+    stack.push("Ben", "0781234568", "Mount Bisoke")
+    assert stack.peek()[0] == "Ben"
+    assert stack.pop().name == "Ben"
+    assert stack.dequeue() == NOT_A_QUEUE
+    stack.close()
+
+    queue = SQLiteBookingStore(str(tmp_path / "queue.db"))
+    queue.enqueue(("Ann", "0781234567", "Mount Bisoke"))
+    queue.enqueue(("Ben", "0781234568", "Mount Bisoke"))
+    assert queue.peek()[0] == "Ann"
+    assert queue.pop() == NOT_A_STACK
+    assert queue.dequeue().name == "Ann"
+    queue.close()
@@ -0,0 +1,20 @@
+from booking_core.stacks import PriorityBookingStack
+
+
+def test_priority_order_rejects_priorities_without_a_deque():
+    stack = PriorityBookingStack(max_size=5, keep_priority_order=True)
+    for priority in (2.5, 7, 0):
+        assert stack.push("Ann", "0781234567", "Mount Bisoke", priority) == "Priority must be a number between 1 and 5."
+    assert len(stack) == 0
+
+    stack.push("Ben", "0791234567", "Mount Bisoke", 3)
+    stack.push("Cat", "0781234568", "Mount Bisoke", 1)
+    assert [booking[0] for booking in stack.priority_order()] == ["Cat", "Ben"]
+
+
+def test_plain_priority_stack_sorts_any_number():
+    stack = PriorityBookingStack(max_size=5)
+    for name, priority in (("Ann", 7), ("Ben", 2.5), ("Cat", 1)):
+        stack.push(name, "0781234567", "Mount Bisoke", priority)
+    stack.bucket_sort()
+    assert [booking[0] for booking in stack.display()] == ["Cat", "Ben", "Ann"]